@@ -4,16 +4,17 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import asyncio
+import threading
 import time
-import json
+import orjson
+from collections import Counter
 from typing import Optional, List, Tuple
-from openai import OpenAI
 
 # Import local tools
 from tools.io import load_reviews, filter_version, calc_share
-from tools.summarise import textrank_summary, chunk_texts, abstractive_summary_chunk, reduce_summaries
-from tools.themes import theme_extract, extract_themes_by_keywords, calculate_theme_distribution_by_keywords
-from tools.metrics import metric_rouge
+from tools.summarise import client, textrank_summary, chunk_texts, abstractive_summary_chunk, reduce_summaries, close_client
+from tools.themes import theme_extract, split_sentences, analyze_themes
+from tools.metrics import metric_rouge_multi
 from tools.html import build_html
 from schema import ReportPayload
 
@@ -32,6 +33,8 @@ class AgentState:
         self.df_ver = None
         self.version = None
         self.reviews_text = None
+        self.sentences = None
+        self.theme_analysis = None
         self.full_text = None
         self.extractive_sum = None
         self.abstractive_result = None
@@ -54,7 +57,11 @@ def filter_and_prep_data(version: str):
     state.df_ver = filter_version(state.df_all, version)
     if state.df_ver.empty:
         return f"Error: No reviews found for version '{version}'."
-    state.reviews_text = state.df_ver['Review Text'].dropna().tolist()
+    # Build the list straight from the column's backing array; missing reviews are NaN floats
+    state.reviews_text = [text for text in state.df_ver['Review Text'].to_numpy() if isinstance(text, str)]
+    # Split once here; both keyword tools reuse the same sentence list
+    state.sentences = split_sentences(state.reviews_text)
+    state.theme_analysis = None
     state.full_text = " ".join(state.reviews_text)
     return f"Successfully filtered for version {version}. Found {len(state.df_ver)} reviews."
 
@@ -68,7 +75,9 @@ async def run_abstractive_summary():
     global state
     if state.reviews_text is None: return "Error: Data not prepped."
 
-    chunks = chunk_texts(state.reviews_text)
+    # Identical reviews are sent to the LLM once and weighted by how often they occur
+    review_counts = Counter(state.reviews_text)
+    chunks = chunk_texts(list(review_counts))
     tasks = [abstractive_summary_chunk(chunk) for chunk in chunks]
     results = await asyncio.gather(*tasks)
 
@@ -80,7 +89,7 @@ async def run_abstractive_summary():
 
     for i, res in enumerate(results):
         content, input_tokens, output_tokens = res
-        chunk_len = len(chunks[i])
+        chunk_len = sum(review_counts[review] for review in chunks[i])
         total_chunk_reviews += chunk_len
 
         mini_summaries.append(content.get("summary", ""))
@@ -142,18 +151,28 @@ async def run_abstractive_summary():
     }
     return "Abstractive summary and themes generated."
 
+_theme_analysis_lock = threading.Lock()
+
+def _get_theme_analysis():
+    """Runs the keyword theme pass once and shares it between the two extractive theme tools."""
+    global state
+    with _theme_analysis_lock:
+        if state.theme_analysis is None:
+            state.theme_analysis = analyze_themes(state.sentences)
+    return state.theme_analysis
+
 def run_extractive_theme_extraction():
     """Extracts themes from the full text using keyword matching for the Extractive approach."""
     global state
-    if state.full_text is None: return "Error: Data not prepped."
-    state.extractive_themes = extract_themes_by_keywords(state.full_text)
+    if state.sentences is None: return "Error: Data not prepped."
+    state.extractive_themes = _get_theme_analysis().themes
     return f"Extracted {len(state.extractive_themes)} themes for Extractive part."
 
 def run_extractive_theme_distribution():
     """Calculates theme distribution for the Extractive approach using keywords."""
     global state
-    if state.full_text is None: return "Error: Data not prepped."
-    state.extractive_theme_distribution = calculate_theme_distribution_by_keywords(state.full_text)
+    if state.sentences is None: return "Error: Data not prepped."
+    state.extractive_theme_distribution = _get_theme_analysis().distribution
     return "Calculated Extractive theme distribution."
 
 def run_share_calculation():
@@ -166,8 +185,9 @@ def run_rouge_metric_calculation():
     global state
     if state.full_text is None or state.extractive_sum is None or state.abstractive_result is None:
         return "Error: Summaries not generated yet."
-    state.rouge_extractive = metric_rouge(state.full_text, state.extractive_sum)
-    state.rouge_abstractive = metric_rouge(state.full_text, state.abstractive_result["final_summary"])
+    state.rouge_extractive, state.rouge_abstractive = metric_rouge_multi(
+        state.full_text, [state.extractive_sum, state.abstractive_result["final_summary"]]
+    )
     return f"Calculated ROUGE-L: extractive={state.rouge_extractive:.2f}, abstractive={state.rouge_abstractive:.2f}"
 
 TOOL_MAPPING = {
@@ -181,10 +201,64 @@ TOOL_MAPPING = {
 }
 
 # --- Main Agent Logic ---
+RUN_STOP_EVENTS = {
+    "thread.run.requires_action",
+    "thread.run.completed",
+    "thread.run.failed",
+    "thread.run.cancelled",
+    "thread.run.expired",
+    "thread.run.incomplete",
+}
+
+async def _consume_run_stream(stream_manager):
+    """Reads run events until the run needs tool outputs or stops, and returns that run."""
+    run = None
+    async with stream_manager as stream:
+        async for event in stream:
+            if event.event in RUN_STOP_EVENTS:
+                run = event.data
+    if run is None:
+        run = stream.current_run
+    return run
+
+async def _call_tool(tool_call) -> dict:
+    func_name = tool_call.function.name
+    try:
+        func_args = orjson.loads(tool_call.function.arguments)
+        print(f"Assistant wants to call: {func_name}({func_args}) ...")
+        func = TOOL_MAPPING.get(func_name)
+        if not func:
+            raise ValueError(f"Tool '{func_name}' not found.")
+
+        # Sync tools are CPU-bound, so they run in worker threads next to the async LLM fan-out
+        if asyncio.iscoroutinefunction(func):
+            output = await func(**func_args)
+        else:
+            output = await asyncio.to_thread(func, **func_args)
+        return {"tool_call_id": tool_call.id, "output": str(output)}
+
+    except Exception as e:
+        print(f"Error calling tool {func_name}: {e}")
+        return {"tool_call_id": tool_call.id, "output": f"Error: {e}"}
+
+async def _dispatch_tool_calls(tool_calls) -> List[dict]:
+    """Runs the requested tools concurrently; data preparation always finishes first."""
+    prep_calls = [call for call in tool_calls if call.function.name == "filter_and_prep_data"]
+    other_calls = [call for call in tool_calls if call.function.name != "filter_and_prep_data"]
+
+    tool_outputs = [await _call_tool(call) for call in prep_calls]
+    tool_outputs.extend(await asyncio.gather(*(_call_tool(call) for call in other_calls)))
+    return tool_outputs
+
 async def run_analysis(csv_path: str, version: Optional[str]):
+    try:
+        await _run_analysis(csv_path, version)
+    finally:
+        await close_client()
+
+async def _run_analysis(csv_path: str, version: Optional[str]):
     global state
     state = AgentState(csv_path)
-    client = OpenAI()
 
     if not version:
         version = state.df_all['App Version Name'].value_counts().idxmax()
@@ -220,7 +294,7 @@ async def run_analysis(csv_path: str, version: Optional[str]):
                 }
             })
 
-    assistant = client.beta.assistants.create(
+    assistant = await client.beta.assistants.create(
         name="Review PM-Agent",
         instructions=(
             "You are a Review PM-Agent. Your goal is to analyze user reviews for a specific software version. "
@@ -233,40 +307,28 @@ async def run_analysis(csv_path: str, version: Optional[str]):
         tools=tools_schema
     )
 
-    thread = client.beta.threads.create()
-    client.beta.threads.messages.create(thread_id=thread.id, role="user", content=f"Please analyze version '{version}'.")
-    run = client.beta.threads.runs.create(thread_id=thread.id, assistant_id=assistant.id)
+    thread = await client.beta.threads.create()
+    await client.beta.threads.messages.create(thread_id=thread.id, role="user", content=f"Please analyze version '{version}'.")
     start_time = time.time()
 
-    while run.status in ['queued', 'in_progress', 'requires_action']:
-        if run.status == 'requires_action':
-            tool_outputs = []
-            for tool_call in run.required_action.submit_tool_outputs.tool_calls:
-                func_name = tool_call.function.name
-                try:
-                    func_args = json.loads(tool_call.function.arguments)
-                    print(f"Assistant wants to call: {func_name}({func_args}) ...")
-                    func = TOOL_MAPPING.get(func_name)
-                    if not func:
-                        raise ValueError(f"Tool '{func_name}' not found.")
-                    
-                    output = await func(**func_args) if asyncio.iscoroutinefunction(func) else func(**func_args)
-                    tool_outputs.append({"tool_call_id": tool_call.id, "output": str(output)})
-
-                except Exception as e:
-                    print(f"Error calling tool {func_name}: {e}")
-                    tool_outputs.append({"tool_call_id": tool_call.id, "output": f"Error: {e}"})
-            
-            run = client.beta.threads.runs.submit_tool_outputs(thread_id=thread.id, run_id=run.id, tool_outputs=tool_outputs)
-        
-        await asyncio.sleep(1)
-        run = client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
-        
-        if run.usage:
-            input_cost = (run.usage.prompt_tokens / 1_000_000) * PRICE_INPUT_PER_1M
-            output_cost = (run.usage.completion_tokens / 1_000_000) * PRICE_OUTPUT_PER_1M
-            state.total_cost_usd += (input_cost + output_cost)
+    # Each stream ends when the run either needs tool outputs or reaches a terminal state,
+    # so there is no polling delay between state changes.
+    stream_manager = client.beta.threads.runs.stream(thread_id=thread.id, assistant_id=assistant.id)
+    while True:
+        run = await _consume_run_stream(stream_manager)
+        if run.status != 'requires_action':
+            break
+
+        tool_outputs = await _dispatch_tool_calls(run.required_action.submit_tool_outputs.tool_calls)
+        stream_manager = client.beta.threads.runs.submit_tool_outputs_stream(
+            thread_id=thread.id, run_id=run.id, tool_outputs=tool_outputs
+        )
 
+    # Run usage is cumulative, so it is only counted once the run has finished
+    if run.usage:
+        input_cost = (run.usage.prompt_tokens / 1_000_000) * PRICE_INPUT_PER_1M
+        output_cost = (run.usage.completion_tokens / 1_000_000) * PRICE_OUTPUT_PER_1M
+        state.total_cost_usd += (input_cost + output_cost)
 
     if run.status == 'completed':
         print("\nAnalysis complete. Generating report...")
@@ -0,0 +1,17 @@
+import hashlib
+import os
+from functools import lru_cache
+from diskcache import Cache
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hw1_agent")
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Cache:
+    """Opens the on-disk cache shared by embeddings and chunk summaries across runs."""
+    return Cache(CACHE_DIR)
+
+
+def content_hash(text: str) -> str:
+    """Returns a stable hash of a text, used as part of cache keys."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -1,16 +1,25 @@
-from jinja2 import Environment, FileSystemLoader
+from functools import lru_cache
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 import os
 from schema import ReportPayload
 
 
+@lru_cache(maxsize=None)
+def _get_template(template_path: str) -> Template:
+    """Builds the Jinja2 environment and compiles the report template once per template directory."""
+    env = Environment(
+        loader=FileSystemLoader(template_path),
+        autoescape=select_autoescape(["html", "html.j2"]),
+        enable_async=False,
+    )
+    return env.get_template("report.html.j2")
+
+
 def build_html(payload: ReportPayload, template_path: str = "templates", output_file: str = "report.html") -> str:
     """Builds an HTML report from a payload using a Jinja2 template."""
-    env = Environment(loader=FileSystemLoader(template_path))
-    template = env.get_template("report.html.j2")
+    template = _get_template(template_path)
 
-    html_content = template.render(payload.model_dump())
+    # Stream the rendered chunks straight to disk instead of holding the whole page in memory
+    template.stream(payload.model_dump(mode="python")).dump(output_file, encoding="utf-8")
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html_content)
-    
     return f"Report saved to {os.path.abspath(output_file)}"
@@ -1,15 +1,36 @@
+import csv
 import pandas as pd
 from typing import Optional, Tuple
 
+# The only columns the agent reads downstream
+REVIEW_COLUMNS = ['App Version Name', 'Reviewer Language', 'Review Text']
+
+
+def detect_separator(file_path: str, encoding: str = 'utf-16') -> str:
+    """Detects the column separator from the header line of the file."""
+    with open(file_path, encoding=encoding) as f:
+        header = f.readline()
+    return csv.Sniffer().sniff(header, delimiters=',\t;|').delimiter
+
 
 def load_reviews(file_path: str) -> Optional[pd.DataFrame]:
     """
     Reads a CSV or TSV file into a pandas DataFrame, automatically detecting the separator.
     """
     try:
-        # Use engine='python' and sep=None to let pandas auto-detect the separator.
-        # This is more robust than guessing.
-        df = pd.read_csv(file_path, sep=None, engine='python', encoding='utf-16')
+        # Sniff the separator from the header once, then let the Arrow parser read only the needed columns.
+        sep = detect_separator(file_path)
+        df = pd.read_csv(
+            file_path,
+            sep=sep,
+            engine='pyarrow',
+            encoding='utf-16',
+            usecols=REVIEW_COLUMNS,
+            dtype={'App Version Name': str},
+        )
+        # Few distinct values: categorical codes make the version/language filter an integer compare.
+        for column in ('App Version Name', 'Reviewer Language'):
+            df[column] = df[column].astype('category')
         print("Successfully loaded reviews.")
         return df
     except Exception as e:
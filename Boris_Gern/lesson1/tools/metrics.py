@@ -1,10 +1,43 @@
-from rouge_score import rouge_scorer
+from typing import List
+from rouge_score import rouge_scorer, tokenizers
+
+# Building the scorer loads the stemmer, so it is done once per process
+_SCORER = rouge_scorer.RougeScorer(['rougeL'], use_stemmer=True)
+_TOKENIZER = tokenizers.DefaultTokenizer(use_stemmer=True)
 
 def metric_rouge(reference: str, candidate: str) -> float:
     """Calculates the ROUGE-L F-score between a reference and a candidate summary."""
     if not reference or not candidate:
         return 0.0
-        
-    scorer = rouge_scorer.RougeScorer(['rougeL'], use_stemmer=True)
-    scores = scorer.score(reference, candidate)
+
+    scores = _SCORER.score(reference, candidate)
     return scores['rougeL'].fmeasure
+
+def _lcs_fmeasure(reference_tokens: List[str], candidate_tokens: List[str]) -> float:
+    """ROUGE-L F-score of two token lists, from their longest common subsequence."""
+    if not reference_tokens or not candidate_tokens:
+        return 0.0
+
+    # One row of the LCS table at a time
+    previous = [0] * (len(candidate_tokens) + 1)
+    for reference_token in reference_tokens:
+        current = [0]
+        for j, candidate_token in enumerate(candidate_tokens):
+            current.append(previous[j] + 1 if reference_token == candidate_token else max(previous[j + 1], current[j]))
+        previous = current
+    lcs = previous[-1]
+
+    precision = lcs / len(candidate_tokens)
+    recall = lcs / len(reference_tokens)
+    return 2 * precision * recall / (precision + recall) if lcs else 0.0
+
+def metric_rouge_multi(reference: str, candidates: List[str]) -> List[float]:
+    """Calculates ROUGE-L F-scores of several candidates, tokenizing the reference only once."""
+    if not reference:
+        return [0.0 for _ in candidates]
+
+    reference_tokens = _TOKENIZER.tokenize(reference)
+    return [
+        _lcs_fmeasure(reference_tokens, _TOKENIZER.tokenize(candidate)) if candidate else 0.0
+        for candidate in candidates
+    ]
@@ -1,19 +1,67 @@
 import asyncio
-import json
+import orjson
+import re
+import ssl
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
+import httpx
+import numpy as np
+import tiktoken
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
 from openai import AsyncOpenAI
-from summa.summarizer import summarize as textrank
+from tools.cache import get_cache, content_hash
 
-client = AsyncOpenAI()
+# One SSL context and one pooled HTTP client shared by every request of the fan-out
+_ssl_context = ssl.create_default_context()
+_http_client = httpx.AsyncClient(
+    verify=_ssl_context,
+    limits=httpx.Limits(max_connections=256, max_keepalive_connections=64, keepalive_expiry=30),
+    http2=True,
+)
+client = AsyncOpenAI(http_client=_http_client)
 MODEL = "gpt-4.1-mini"
 
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+def _textrank_scores(sentences: List[str], damping: float = 0.85, iterations: int = 30) -> np.ndarray:
+    """Ranks sentences by power iteration over a sparse TF-IDF cosine-similarity graph."""
+    tfidf = TfidfVectorizer(min_df=2).fit_transform(sentences)  # rows are L2-normalised
+    similarity = (tfidf @ tfidf.T).tocsr()
+    similarity.setdiag(0)
+    similarity.eliminate_zeros()
+
+    row_sums = np.asarray(similarity.sum(axis=1)).ravel()
+    row_sums[row_sums == 0] = 1.0
+    transition_t = (sparse.diags(1.0 / row_sums) @ similarity).T.tocsr()
+
+    n = len(sentences)
+    scores = np.full(n, 1.0 / n)
+    for _ in range(iterations):
+        scores = (1 - damping) / n + damping * (transition_t @ scores)
+    return scores
+
 def textrank_summary(text: str, max_chars: int = 1200) -> str:
     """Generates an extractive summary using TextRank with a character limit."""
     if not text or len(text) < max_chars:
         return text
 
-    # Generate a summary using a ratio, then truncate. 0.2 is a heuristic.
-    summary = textrank(text, ratio=0.2) or text
+    sentences = [s for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+    try:
+        scores = _textrank_scores(sentences)
+    except ValueError:
+        # No term occurs in two sentences, so there is no graph to rank
+        scores = np.zeros(len(sentences))
+
+    # Take the best-ranked sentences that fit the budget, then restore their original order
+    chosen, used = [], 0
+    for idx in np.argsort(-scores, kind="stable"):
+        length = len(sentences[idx]) + 1
+        if chosen and used + length > max_chars:
+            continue
+        chosen.append(idx)
+        used += length
+    summary = " ".join(sentences[idx] for idx in sorted(chosen)) or text
 
     if len(summary) > max_chars:
         # Find the last sentence end before the limit to avoid cutting mid-sentence
@@ -26,13 +74,30 @@ def textrank_summary(text: str, max_chars: int = 1200) -> str:
 
     return summary
 
-def chunk_texts(texts: List[str], chunk_size: int = 10) -> List[List[str]]:
-    return [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    # o200k_base is the tokenizer of the gpt-4o / gpt-4.1 model families
+    return tiktoken.get_encoding("o200k_base")
 
-async def abstractive_summary_chunk(chunk: List[str]) -> Tuple[Dict[str, Any], int, int]:
-    prompt_text = "\n\n---\n\n".join(chunk)
+@lru_cache(maxsize=65536)
+def _count_tokens(text: str) -> int:
+    return len(_get_encoding().encode(text))
+
+def chunk_texts(texts: List[str], max_tokens: int = 3000) -> List[List[str]]:
+    """Greedily packs texts into chunks of at most max_tokens input tokens each."""
+    chunks, current, current_tokens = [], [], 0
+    for text in texts:
+        tokens = _count_tokens(text)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
 
-    system_prompt = """
+CHUNK_SYSTEM_PROMPT = """
     Analyze user reviews in Russian. Provide a concise summary and extract one representative quote for each category: Praise, Pain, and Request.
     Format your response as a single JSON object with five keys: "summary", "praise", "pain", "request", "distribution".
     The response must be a valid JSON.
@@ -50,11 +115,21 @@ async def abstractive_summary_chunk(chunk: List[str]) -> Tuple[Dict[str, Any], i
     }
     """
 
+async def abstractive_summary_chunk(chunk: List[str]) -> Tuple[Dict[str, Any], int, int]:
+    prompt_text = "\n\n---\n\n".join(chunk)
+
+    # Re-runs over the same reviews reuse the stored result at no token cost; editing the
+    # system prompt changes the key, so results of the old prompt are not served
+    cache_key = (MODEL, content_hash(CHUNK_SYSTEM_PROMPT), content_hash(prompt_text))
+    cached = get_cache().get(cache_key)
+    if cached is not None:
+        return (cached, 0, 0)
+
     response = await client.chat.completions.create(
         model=MODEL,
         response_format={"type": "json_object"},
         messages=[
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": CHUNK_SYSTEM_PROMPT},
             {"role": "user", "content": prompt_text}
         ],
         max_tokens=400,
@@ -62,34 +137,61 @@ async def abstractive_summary_chunk(chunk: List[str]) -> Tuple[Dict[str, Any], i
     )
 
     try:
-        content = json.loads(response.choices[0].message.content)
-    except (json.JSONDecodeError, KeyError):
+        content = orjson.loads(response.choices[0].message.content)
+        get_cache().set(cache_key, content)
+    except (orjson.JSONDecodeError, KeyError):
         content = {"summary": "", "praise": "", "pain": "", "request": ""}
 
     usage = response.usage
     return (content, usage.prompt_tokens, usage.completion_tokens)
 
-async def reduce_summaries(items: List[str], system_prompt: str = None) -> Tuple[str, int, int]:
-    if not items:
-        return "", 0, 0
-
-    # Default prompt for backward compatibility
-    if system_prompt is None:
-        system_prompt = "Synthesize these mini-summaries into one final, fluent summary in Russian (max 200 words)."
-
-    combined_text = "\n\n---\n\n".join(filter(None, items)) # Filter out empty strings
-    if not combined_text:
-        return "", 0, 0
+# Identical for every reduce call so the provider can serve it from the prompt cache;
+# what to synthesize is stated at the top of the user message instead.
+REDUCE_SYSTEM_PROMPT = (
+    "You merge partial analyses of user reviews written in Russian. "
+    "Follow the instruction on the first line of the user message and answer in Russian."
+)
+DEFAULT_REDUCE_INSTRUCTION = "Synthesize these mini-summaries into one final, fluent summary in Russian (max 200 words)."
+REDUCE_GROUP_SIZE = 8
+REDUCE_MAX_ITEMS = 20
 
+async def _reduce_once(items: List[str], instruction: str) -> Tuple[str, int, int]:
+    combined_text = "\n\n---\n\n".join(items)
     response = await client.chat.completions.create(
         model=MODEL,
         messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": combined_text}
+            {"role": "system", "content": REDUCE_SYSTEM_PROMPT},
+            {"role": "user", "content": f"{instruction}\n\n{combined_text}"}
         ],
         max_tokens=400,
         temperature=0.5,
     )
     final_summary = response.choices[0].message.content
     usage = response.usage
-    return (final_summary.strip() if final_summary else "", usage.prompt_tokens, usage.completion_tokens)
\ No newline at end of file
+    return (final_summary.strip() if final_summary else "", usage.prompt_tokens, usage.completion_tokens)
+
+async def reduce_summaries(items: List[str], instruction: str = None) -> Tuple[str, int, int]:
+    if instruction is None:
+        instruction = DEFAULT_REDUCE_INSTRUCTION
+
+    items = [item for item in items if item]  # Filter out empty strings
+    if not items:
+        return "", 0, 0
+
+    # Too many items for one request: reduce them in groups, then reduce the group results
+    input_tokens, output_tokens = 0, 0
+    while len(items) > REDUCE_MAX_ITEMS:
+        groups = [items[i:i + REDUCE_GROUP_SIZE] for i in range(0, len(items), REDUCE_GROUP_SIZE)]
+        results = await asyncio.gather(*(_reduce_once(group, instruction) for group in groups))
+        items = [text for text, _, _ in results if text]
+        input_tokens += sum(res[1] for res in results)
+        output_tokens += sum(res[2] for res in results)
+        if not items:
+            return "", input_tokens, output_tokens
+
+    final_summary, final_input, final_output = await _reduce_once(items, instruction)
+    return final_summary, input_tokens + final_input, output_tokens + final_output
+
+async def close_client() -> None:
+    """Closes the shared HTTP connection pool."""
+    await client.close()
@@ -1,21 +1,59 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
 import re
+import ahocorasick
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
 from sentence_transformers import SentenceTransformer
-
-# Initialize the model once and reuse it
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+from tools.cache import get_cache, content_hash
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+@lru_cache(maxsize=1)
+def _get_model() -> SentenceTransformer:
+    """Loads the embedding model on first use and reuses it afterwards."""
+    return SentenceTransformer(EMBEDDING_MODEL)
+
+# Embeddings of already seen texts, keyed by content hash
+_emb_cache: Dict[str, np.ndarray] = {}
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """Embeds texts, encoding each distinct text only once and reusing cached embeddings."""
+    hashes = [content_hash(t) for t in texts]
+    missing = {h: t for h, t in zip(hashes, texts) if h not in _emb_cache}
+
+    # Fill from the on-disk cache first, so only never-seen texts reach the model
+    disk_cache = get_cache()
+    for h in list(missing):
+        cached = disk_cache.get((EMBEDDING_MODEL, h))
+        if cached is not None:
+            _emb_cache[h] = cached
+            del missing[h]
+
+    if missing:
+        embeddings = _get_model().encode(
+            list(missing.values()),
+            batch_size=128,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        )
+        for h, embedding in zip(missing.keys(), embeddings):
+            _emb_cache[h] = embedding
+            disk_cache.set((EMBEDDING_MODEL, h), embedding)
+    return np.stack([_emb_cache[h] for h in hashes])
 
 def theme_extract(texts: List[str], n_clusters: int = 3) -> List[Dict[str, Any]]:
     """Extracts themes from texts using embeddings and k-means clustering."""
     if not texts or len(texts) < n_clusters:
         return []
 
-    embeddings = model.encode(texts, show_progress_bar=False)
+    # Duplicates keep their rows, so they still weigh on the clustering
+    embeddings = embed_texts(texts)
 
-    # Use n_init='auto' to avoid FutureWarning
-    kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init='auto')
+    # A few mini-batch restarts are enough for a handful of clusters on unit-norm embeddings
+    kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=256, n_init=3, random_state=42)
     kmeans.fit(embeddings)
 
     themes = []
@@ -28,8 +66,9 @@ def theme_extract(texts: List[str], n_clusters: int = 3) -> List[Dict[str, Any]]
 
         cluster_embeddings = embeddings[cluster_indices]
         centroid = kmeans.cluster_centers_[i]
-        distances = np.linalg.norm(cluster_embeddings - centroid, axis=1)
-        
+        # For unit-norm embeddings the nearest point to the centroid is the one with the largest dot product
+        distances = 1 - cluster_embeddings @ centroid
+
         closest_sentence_index_in_cluster = np.argmin(distances)
         original_index = cluster_indices[closest_sentence_index_in_cluster]
         
@@ -49,60 +88,76 @@ THEME_KEYWORDS = {
     "Request": ['почините', 'добавьте', 'верните', 'хотелось бы', 'сделайте', 'улучшите', 'прошу', 'нужно', 'надо', 'пожалуйста', 'предлагаю', 'расширьте', 'хочется']
 }
 
-def calculate_theme_distribution_by_keywords(text: str) -> Dict[str, float]:
-    """Calculates the percentage distribution of themes based on keyword counts in sentences."""
-    sentences = text.split('.')
-    if not sentences: return {}
+# One Aho-Corasick automaton over the keywords of all themes, so a sentence is scanned once
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for _theme, _kws in THEME_KEYWORDS.items():
+    for _kw in _kws:
+        KEYWORD_AUTOMATON.add_word(_kw, (_theme, _kw))
+KEYWORD_AUTOMATON.make_automaton()
+
+SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+def split_sentences(texts: List[str]) -> List[str]:
+    """Splits every review into non-empty, stripped sentences."""
+    return [s.strip() for text in texts for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+
+def _score_sentence(sentence: str) -> Dict[str, int]:
+    """Counts the distinct keywords of each theme found in a sentence."""
+    matched = {theme: set() for theme in THEME_KEYWORDS}
+    # Lowercased once per sentence, not once per keyword
+    for _, (theme, kw) in KEYWORD_AUTOMATON.iter(sentence.lower()):
+        matched[theme].add(kw)
+    return {theme: len(kws) for theme, kws in matched.items()}
+
+def _keep_best(ranked: List[Tuple[int, str]], score: int, sentence: str, limit: int) -> None:
+    """Inserts a candidate quote into a short list ordered by score; earlier sentences win ties."""
+    if any(existing == sentence for _, existing in ranked):
+        return
+    position = len(ranked)
+    while position > 0 and ranked[position - 1][0] < score:
+        position -= 1
+    if position < limit:
+        ranked.insert(position, (score, sentence))
+        del ranked[limit:]
+
+@dataclass
+class ThemeAnalysis:
+    themes: List[Dict[str, str]]
+    distribution: Dict[str, float]
+
+def analyze_themes(sentences: List[str]) -> ThemeAnalysis:
+    """Extracts keyword themes and their sentence distribution in a single pass over the sentences."""
+    if not sentences:
+        return ThemeAnalysis(themes=[], distribution={})
 
     theme_counts = {"Praise": 0, "Pain": 0, "Request": 0, "Neutral": 0}
+    # A theme can lose its best quotes to the themes picked before it, so keep that many spares
+    candidates = {theme: [] for theme in THEME_KEYWORDS}
 
     for sentence in sentences:
-        if not sentence.strip():
-            continue
+        scores = _score_sentence(sentence)
 
-        scores = {theme: 0 for theme in THEME_KEYWORDS}
-        for theme, kws in THEME_KEYWORDS.items():
-            for kw in kws:
-                if kw in sentence.lower():
-                    scores[theme] += 1
-        
         max_score = 0
         best_theme = "Neutral"
         for theme, score in scores.items():
             if score > max_score:
                 max_score = score
                 best_theme = theme
-        
-        if max_score > 0:
-            theme_counts[best_theme] += 1
-        else:
-            theme_counts["Neutral"] += 1
-            
+            if score > 0:
+                _keep_best(candidates[theme], score, sentence, len(THEME_KEYWORDS))
+
+        theme_counts[best_theme] += 1
+
     total_sentences = len(sentences)
     distribution = {theme: (count / total_sentences) * 100 for theme, count in theme_counts.items()}
-    return distribution
-
-def extract_themes_by_keywords(full_text: str) -> List[Dict[str, str]]:
-    """Extracts themes by finding sentences with the highest count of keywords for each theme."""
-    sentences = re.split(r'[.!?]', full_text)
-    if not sentences:
-        return []
 
     themes = []
     found_quotes = set()
-
-    for theme_name, keywords in THEME_KEYWORDS.items():
-        best_sentence = ""
-        max_score = 0
-        for sentence in sentences:
-            # Simple scoring: count occurrences of keywords
-            score = sum(1 for keyword in keywords if keyword in sentence.lower())
-            if score > max_score and sentence not in found_quotes:
-                max_score = score
-                best_sentence = sentence.strip()
-        
-        if best_sentence:
-            themes.append({"name": theme_name, "quote": best_sentence})
-            found_quotes.add(best_sentence) # Ensure the same quote isn't used for multiple themes
-
-    return themes
+    for theme_name in THEME_KEYWORDS:
+        for _, sentence in candidates[theme_name]:
+            if sentence not in found_quotes:
+                themes.append({"name": theme_name, "quote": sentence})
+                found_quotes.add(sentence) # Ensure the same quote isn't used for multiple themes
+                break
+
+    return ThemeAnalysis(themes=themes, distribution=distribution)
@@ -5,14 +5,12 @@ Clean architecture with separated concerns and proper error handling.
 """
 
 import streamlit as st
-import sys
 import os
-
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from dataclasses import astuple
 
 from src.config.settings import AppConfig
-from src.services.data_service import DataService
+from src.models.summary import ComparisonResult
+from src.services.data_service import get_data_service
 from src.ui.components import UIComponents
 from src.utils.charts import ChartUtils
 from src.utils.logger import Logger
@@ -30,7 +28,7 @@ def configure_page():
 
 def check_analysis_status():
     """Check if analysis has been completed."""
-    data_service = DataService()
+    data_service = get_data_service()
     
     # Check if both reviews and results files exist
     has_reviews = data_service.file_exists(AppConfig.DEFAULT_REVIEWS_FILE)
@@ -39,25 +37,50 @@ def check_analysis_status():
     return has_reviews and has_results
 
 
-def load_data():
-    """Load data from default files only."""
-    data_service = DataService()
+def get_file_mtime(file_path):
+    """Return file modification time, or None if the file does not exist."""
+    try:
+        return os.path.getmtime(file_path)
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def load_data(reviews_path, reviews_mtime, results_path, results_mtime):
+    """
+    Load data from the given files.
+    
+    The modification times are part of the cache key, so files are parsed again
+    only when they change on disk.
+    """
+    data_service = get_data_service()
     
     reviews_data = None
     results_data = None
     
-    # Load from default files only
-    if data_service.file_exists(AppConfig.DEFAULT_REVIEWS_FILE):
-        reviews_data = data_service.load_reviews_data(AppConfig.DEFAULT_REVIEWS_FILE)
+    if reviews_mtime is not None:
+        reviews_data = data_service.load_reviews_data(reviews_path)
     
-    if data_service.file_exists(AppConfig.DEFAULT_RESULTS_FILE):
-        results_data = data_service.load_results_data(AppConfig.DEFAULT_RESULTS_FILE)
+    if results_mtime is not None:
+        results_data = data_service.load_results_data(results_path)
     
     analysis_complete = reviews_data is not None and results_data is not None
     
     return reviews_data, results_data, analysis_complete
 
 
+def _comparison_metrics_key(results_data):
+    """Cache key for the radar chart: the only inputs it plots are the metric values."""
+    metrics = results_data.comparison_metrics if results_data else None
+    return astuple(metrics) if metrics else None
+
+
+@st.cache_resource(show_spinner=False, hash_funcs={ComparisonResult: _comparison_metrics_key})
+def get_comparison_metrics_chart(results_data):
+    """Build the comparison metrics radar chart once per set of metric values."""
+    return ChartUtils.create_comparison_metrics_chart(results_data)
+
+
 def render_overview_tab(reviews_data, results_data):
     """Render overview tab."""
     UIComponents.render_project_overview(reviews_data, results_data)
@@ -102,7 +125,7 @@ def render_analytics_tab(reviews_data, results_data):
         
         # Comparison metrics radar chart
         if results_data:
-            fig_comparison = ChartUtils.create_comparison_metrics_chart(results_data)
+            fig_comparison = get_comparison_metrics_chart(results_data)
             st.plotly_chart(fig_comparison, use_container_width=True)
     else:
         st.info("Загрузите данные отзывов для отображения аналитики")
@@ -160,20 +183,28 @@ def main():
         UIComponents.render_page_header()
         
         # Load data and check analysis status
-        reviews_data, results_data, analysis_complete = load_data()
+        reviews_data, results_data, analysis_complete = load_data(
+            AppConfig.DEFAULT_REVIEWS_FILE,
+            get_file_mtime(AppConfig.DEFAULT_REVIEWS_FILE),
+            AppConfig.DEFAULT_RESULTS_FILE,
+            get_file_mtime(AppConfig.DEFAULT_RESULTS_FILE)
+        )
         
         # Sidebar with status only
         st.sidebar.title("📊 Статус анализа")
         
+        # One element per status block keeps each rerun to a single sidebar delta
         if analysis_complete:
-            st.sidebar.success("✅ Данные загружены")
+            status_lines = ["✅ Данные загружены"]
             if reviews_data and reviews_data.metadata:
-                st.sidebar.info(f"📱 Приложение: {reviews_data.metadata.app_id}")
-                st.sidebar.info(f"📊 Отзывов: {reviews_data.metadata.total_reviews}")
-                st.sidebar.info(f"📅 Дата: {reviews_data.metadata.scraped_at[:10]}")
+                status_lines += [
+                    f"📱 Приложение: {reviews_data.metadata.app_id}",
+                    f"📊 Отзывов: {reviews_data.metadata.total_reviews}",
+                    f"📅 Дата: {reviews_data.metadata.scraped_at[:10]}"
+                ]
+            st.sidebar.success("\n\n".join(status_lines))
         else:
-            st.sidebar.error("❌ Данные не найдены")
-            st.sidebar.info("Запустите анализ через CLI")
+            st.sidebar.error("❌ Данные не найдены\n\nЗапустите анализ через CLI")
         
         # Conditional rendering based on analysis status
         if not analysis_complete:
@@ -198,9 +229,7 @@ def main():
                 render_analytics_tab(reviews_data, results_data)
         
         # Footer
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("**📊 MBank Reviews Analysis**")
-        st.sidebar.markdown("Read-only dashboard")
+        st.sidebar.markdown("---\n\n**📊 MBank Reviews Analysis**\n\nRead-only dashboard")
         
     except Exception as e:
         logger.error(f"Dashboard error: {str(e)}")
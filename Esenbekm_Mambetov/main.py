@@ -9,9 +9,6 @@ import sys
 import os
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 from src.config.settings import AppConfig
 from src.services.analysis_service import AnalysisService
 from src.services.data_service import DataService
@@ -111,6 +108,56 @@ def analyze_existing(args):
         sys.exit(f"Error: Analysis failed - {e}")
 
 
+def analyze_batch(args):
+    """Analyze several apps offline through the OpenAI Batch API."""
+    logger = Logger.setup_logger()
+    
+    if not args.openai_key:
+        logger.error("OpenAI API key is required")
+        sys.exit("Error: OpenAI API key is required")
+    
+    try:
+        logger.info(f"Starting batch analysis for apps: {', '.join(args.app_ids)}")
+        
+        analysis_service = AnalysisService(args.openai_key)
+        results = analysis_service.analyze_apps_batch(
+            app_ids=args.app_ids,
+            review_count=args.count
+        )
+        
+        print(f"\n✅ Batch analysis complete for {len(results)} apps. Results saved to: {AppConfig.RESULTS_DIR}")
+        logger.info("Batch analysis completed successfully")
+        
+    except Exception as e:
+        logger.error(f"Batch analysis failed: {str(e)}")
+        sys.exit(f"Error: Batch analysis failed - {e}")
+
+
+def analyze_apps(args):
+    """Analyze several apps, summarizing them together in shared agent prompts."""
+    logger = Logger.setup_logger()
+    
+    if not args.openai_key:
+        logger.error("OpenAI API key is required")
+        sys.exit("Error: OpenAI API key is required")
+    
+    try:
+        logger.info(f"Starting multi-app analysis for apps: {', '.join(args.app_ids)}")
+        
+        analysis_service = AnalysisService(args.openai_key)
+        results = analysis_service.analyze_apps(
+            app_ids=args.app_ids,
+            review_count=args.count
+        )
+        
+        print(f"\n✅ Analysis complete for {len(results)} apps. Results saved to: {AppConfig.RESULTS_DIR}")
+        logger.info("Multi-app analysis completed successfully")
+        
+    except Exception as e:
+        logger.error(f"Multi-app analysis failed: {str(e)}")
+        sys.exit(f"Error: Multi-app analysis failed - {e}")
+
+
 def validate_setup(args):
     """Validate system setup."""
     if not args.openai_key:
@@ -143,6 +190,12 @@ Examples:
   # Analyze existing reviews
   python main_refactored.py analyze-existing --reviews-file reviews.json --openai-key your_key
 
+  # Analyze several apps, summarized together in shared prompts
+  python main_refactored.py analyze-apps --app-ids com.example.one com.example.two --openai-key your_key
+
+  # Analyze several apps offline via the Batch API (results may take up to 24h)
+  python main_refactored.py analyze-batch --app-ids com.example.one com.example.two --openai-key your_key
+
   # Validate setup
   python main_refactored.py validate --openai-key your_key
         """
@@ -197,6 +250,46 @@ Examples:
         help=f'Output file for results (default: {AppConfig.DEFAULT_RESULTS_FILE})'
     )
     
+    # Multi-app analysis command
+    apps_parser = subparsers.add_parser('analyze-apps', help='Analyze several apps in shared agent prompts')
+    apps_parser.add_argument(
+        '--app-ids',
+        nargs='+',
+        required=True,
+        help='Google Play Store app IDs'
+    )
+    apps_parser.add_argument(
+        '--count',
+        type=int,
+        default=AppConfig.DEFAULT_REVIEW_COUNT,
+        help=f'Number of reviews to analyze per app (default: {AppConfig.DEFAULT_REVIEW_COUNT})'
+    )
+    apps_parser.add_argument(
+        '--openai-key',
+        default=os.getenv('OPENAI_API_KEY'),
+        help='OpenAI API key (or set OPENAI_API_KEY env var)'
+    )
+    
+    # Batch analysis command
+    batch_parser = subparsers.add_parser('analyze-batch', help='Analyze several apps via the OpenAI Batch API')
+    batch_parser.add_argument(
+        '--app-ids',
+        nargs='+',
+        required=True,
+        help='Google Play Store app IDs'
+    )
+    batch_parser.add_argument(
+        '--count',
+        type=int,
+        default=AppConfig.DEFAULT_REVIEW_COUNT,
+        help=f'Number of reviews to analyze per app (default: {AppConfig.DEFAULT_REVIEW_COUNT})'
+    )
+    batch_parser.add_argument(
+        '--openai-key',
+        default=os.getenv('OPENAI_API_KEY'),
+        help='OpenAI API key (or set OPENAI_API_KEY env var)'
+    )
+    
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate system setup')
     validate_parser.add_argument(
@@ -216,6 +309,10 @@ Examples:
         run_analysis(args)
     elif args.command == 'analyze-existing':
         analyze_existing(args)
+    elif args.command == 'analyze-apps':
+        analyze_apps(args)
+    elif args.command == 'analyze-batch':
+        analyze_batch(args)
     elif args.command == 'validate':
         validate_setup(args)
 
@@ -4,6 +4,7 @@ Dashboard launcher for MBank Reviews Analysis System.
 Provides options to run original or refactored version.
 """
 
+import os
 import subprocess
 import sys
 import argparse
@@ -43,14 +44,12 @@ def run_dashboard(dashboard_file: str, port: int = 8501, host: str = "localhost"
     if not dashboard_path.exists():
         raise FileNotFoundError(f"Dashboard file not found: {dashboard_path}")
     
-    try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", str(dashboard_path),
-            "--server.port", str(port),
-            "--server.address", host
-        ])
-    except KeyboardInterrupt:
-        pass
+    # Replace this process with streamlit; signals such as Ctrl-C go straight to it
+    os.execvp(sys.executable, [
+        sys.executable, "-m", "streamlit", "run", str(dashboard_path),
+        "--server.port", str(port),
+        "--server.address", host
+    ])
 
 
 def check_analysis_files():
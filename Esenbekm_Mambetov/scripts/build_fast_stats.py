@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the rating statistics kernels.
+
+Compiles the kernels of src/utils/fast_stats.py into a native extension module
+(src/utils/_fast_stats_aot.*.so) that fast_stats picks up instead of JIT-compiling.
+Re-run after changing the kernels. Run from the project root:
+
+    python -m scripts.build_fast_stats
+"""
+
+import os
+
+from numba.pycc import CC
+
+from src.utils import fast_stats
+
+
+def main():
+    cc = CC('_fast_stats_aot')
+    cc.output_dir = os.path.dirname(os.path.abspath(fast_stats.__file__))
+    cc.verbose = True
+
+    cc.export('rating_histogram', fast_stats.RATING_HISTOGRAM_SIGNATURE)(fast_stats._rating_histogram)
+    cc.export('avg_rating', fast_stats.AVG_RATING_SIGNATURE)(fast_stats._avg_rating)
+
+    cc.compile()
+    print(f"✅ Built {cc.name} in {cc.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -29,7 +31,19 @@ class AppConfig:
     
     # Processing settings
     BATCH_SIZE = 200
+    SCRAPE_PAGE_SIZE = 4500  # reviews per Play Store request; the most one request returns
+    
+    # On-disk cache of Play Store responses, so re-runs skip the network
+    SCRAPE_CACHE_FILE = "results/play_store_cache.sqlite"
+    SCRAPE_CACHE_TTL = 3600  # seconds
+    
+    # Retries of failed Play Store requests, with exponential backoff
+    SCRAPE_RETRY_ATTEMPTS = 5
+    SCRAPE_RETRY_WAIT = 0.5  # seconds before the first retry; doubles each attempt
+    SCRAPE_RETRY_MAX_WAIT = 30  # seconds
+    APP_CHECK_TIMEOUT = 5  # seconds for the app-exists check
     MAX_REVIEWS_LIMIT = 10000
+    STREAMING_JSON_THRESHOLD = 10 * 1024 * 1024  # bytes; larger files are parsed incrementally
     
     # UI settings
     LAYOUT = "wide"
@@ -46,13 +60,44 @@ class SummarizationConfig:
     # GPT settings
     GPT_MODEL = "gpt-4"
     GPT_MAX_TOKENS = 500
+    GPT_EVALUATION_MAX_TOKENS = 300  # extra room when the summary and its evaluation share one response
     GPT_TEMPERATURE = 0.3
     
     # OpenAI Agents SDK settings
-    AGENT_MODEL = "gpt-4"
+    AGENT_MODEL = "gpt-4o"  # evaluations and multi-app summaries use JSON-schema structured outputs, which gpt-4 lacks
     AGENT_TEMPERATURE = 0.3
     AGENT_MAX_TOKENS = 1000
     AGENT_TIMEOUT = 60  # seconds
+    AGENT_CONCURRENCY = 8  # agent runs in flight at once; size to the account's rate limit
+    AGENT_PROMPT_CACHE_KEY = "mbank-review-analysis"
+    
+    # Several apps summarized in one agent prompt (AnalysisService.analyze_apps)
+    AGENT_CONTEXT_TOKENS = 128000  # context window of AGENT_MODEL
+    AGENT_OUTPUT_TOKENS = 16384  # most tokens AGENT_MODEL writes in one answer
+    AGENT_SUMMARY_TOKENS = 300  # answer budget reserved per app
+    
+    # Token budget for review texts in one app's prompt (about what 30 reviews x 200 chars used)
+    AGENT_REVIEW_TOKENS = 3000
+    
+    # Minimum input for an agent summary; smaller inputs get a templated one
+    AGENT_MIN_REVIEWS = 3
+    AGENT_MIN_CHARS = 500
+    
+    # Shared HTTP connection pool for OpenAI requests
+    HTTP_MAX_CONNECTIONS = 128
+    HTTP_MAX_KEEPALIVE_CONNECTIONS = 64
+    HTTP_KEEPALIVE_EXPIRY = 60  # seconds
+    HTTP_CONNECT_TIMEOUT = 10  # seconds
+    
+    # Semantic response cache for agent calls
+    SEMANTIC_CACHE_FILE = "results/agent_cache.sqlite"
+    SEMANTIC_CACHE_THRESHOLD = 0.95  # minimum cosine similarity for a cache hit
+    SEMANTIC_CACHE_MAX_ENTRIES = 10000
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    
+    # OpenAI Batch API settings (offline multi-app analysis)
+    BATCH_COMPLETION_WINDOW = "24h"
+    BATCH_POLL_INTERVAL = 60  # seconds
     
     # Analysis prompts
     SUMMARIZATION_PROMPT = """
@@ -132,6 +177,9 @@ class UIConfig:
     # Chart color schemes
     RATING_COLOR_SCALE = "RdYlGn"
     
+    # Point-based charts switch from SVG to WebGL rendering at this many reviews
+    WEBGL_MIN_POINTS = 1000
+    
     # Tab names
     TAB_NAMES = [
         "📊 Обзор", 
@@ -147,16 +195,31 @@ def get_env_var(var_name: str, default: Any = None) -> Any:
     return os.getenv(var_name, default)
 
 
+ENV_LINE_PATTERN = re.compile(r'(?m)^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$')
+
+
+# Variables set from .env, with the values set; a reload may overwrite these but no others
+_ENV_FILE_VALUES: Dict[str, str] = {}
+
+
+@lru_cache(maxsize=1)
+def _apply_env_file(env_file: Path, mtime_ns: int) -> None:
+    """Parse the .env file in one regex pass; cached until the file changes."""
+    for key, value in ENV_LINE_PATTERN.findall(env_file.read_text()):
+        # Variables set elsewhere take precedence over .env; ones it set before are updated
+        if key not in os.environ or os.environ[key] == _ENV_FILE_VALUES.get(key):
+            os.environ[key] = value
+            _ENV_FILE_VALUES[key] = value
+
+
 def load_env_file():
     """Load environment variables from .env file if it exists."""
     env_file = Path(__file__).parent.parent.parent / ".env"
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key.strip()] = value.strip()
+    try:
+        mtime_ns = env_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    _apply_env_file(env_file, mtime_ns)
 
 
 def get_openai_config() -> Dict[str, Any]:
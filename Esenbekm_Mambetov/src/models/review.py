@@ -1,10 +1,16 @@
 """Data models for review analysis system."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Sequence, Union
 
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
-@dataclass
+from ..utils.fast_stats import avg_rating
+
+
+@dataclass(slots=True)
 class Review:
     """Structure for storing app review data."""
     id: str
@@ -35,7 +41,7 @@ class Review:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewsMetadata:
     """Metadata for scraped reviews."""
     app_id: str
@@ -66,12 +72,182 @@ class ReviewsMetadata:
         )
 
 
-@dataclass
+REVIEW_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('rating', pa.int64()),
+    ('text', pa.string()),
+    ('author', pa.string()),
+    ('date', pa.string()),
+])
+
+
+def _string_column(table: pa.Table, name: str) -> np.ndarray:
+    """Extract a string column as an object array, with missing values as ''."""
+    return pc.fill_null(table.column(name), '').to_numpy(zero_copy_only=False)
+
+
+def _parse_day(value: str) -> np.datetime64:
+    """Parse one date string to a day; anything unparseable becomes NaT."""
+    try:
+        return np.datetime64(value).astype('datetime64[D]') if value else np.datetime64('NaT', 'D')
+    except ValueError:
+        return np.datetime64('NaT', 'D')
+
+
+def parse_days(dates: np.ndarray) -> np.ndarray:
+    """
+    Parse date strings to a datetime64[D] array.
+    
+    ISO dates and timestamps are cut to the day; empty or unparseable values
+    (e.g. "02/01/2024") become NaT instead of failing the whole column.
+    
+    Args:
+        dates: Object array of date strings
+        
+    Returns:
+        datetime64[D] array
+    """
+    try:
+        return dates.astype('datetime64[D]')
+    except ValueError:
+        return np.array([_parse_day(value) for value in dates], dtype='datetime64[D]')
+
+
+def _coerce_rating(value: Any) -> int:
+    """Rating as an int; values that are not numbers become 0 (missing)."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _coerce_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Review dict with the value types of REVIEW_SCHEMA, as Review.from_dict would accept them."""
+    text = {field: record.get(field) for field in ('id', 'text', 'author', 'date')}
+    coerced = {field: '' if value is None else str(value) for field, value in text.items()}
+    coerced['rating'] = _coerce_rating(record.get('rating', 0))
+    return coerced
+
+
+def records_to_batch(records: List[Dict[str, Any]]) -> pa.RecordBatch:
+    """
+    Convert review dicts to an Arrow record batch with the review schema.
+    
+    Well-formed records take a single Arrow conversion; if any value does not
+    fit the schema (an int id, a "5" rating), the records are coerced first.
+    
+    Args:
+        records: Review dictionaries
+        
+    Returns:
+        Record batch with REVIEW_SCHEMA
+    """
+    try:
+        return pa.RecordBatch.from_pylist(records, schema=REVIEW_SCHEMA)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.RecordBatch.from_pylist([_coerce_record(record) for record in records], schema=REVIEW_SCHEMA)
+
+
+@dataclass(slots=True)
+class ReviewsColumnar:
+    """
+    Struct-of-arrays storage for reviews; indexing yields Review objects.
+    
+    dates keeps the date strings as loaded, so records round-trip unchanged;
+    days is the datetime64[D] view of them for date arithmetic (NaT if unparseable).
+    """
+    ids: np.ndarray
+    ratings: np.ndarray
+    texts: np.ndarray
+    authors: np.ndarray
+    dates: np.ndarray
+    days: np.ndarray
+    
+    @classmethod
+    def from_table(cls, table: pa.Table) -> 'ReviewsColumnar':
+        """Create columnar reviews from an Arrow table with the review schema."""
+        ratings = pc.fill_null(table.column('rating'), 0).to_numpy(zero_copy_only=False)
+        dates = _string_column(table, 'date')
+        return cls(
+            ids=_string_column(table, 'id'),
+            ratings=ratings.astype(np.int8),
+            texts=_string_column(table, 'text'),
+            authors=_string_column(table, 'author'),
+            dates=dates,
+            days=parse_days(dates)
+        )
+    
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> 'ReviewsColumnar':
+        """Create columnar reviews from review dictionaries in one Arrow conversion."""
+        return cls.from_table(pa.Table.from_batches([records_to_batch(records)]))
+    
+    @classmethod
+    def from_reviews(cls, reviews: Sequence[Review]) -> 'ReviewsColumnar':
+        """Create columnar reviews from Review objects."""
+        return cls.from_records([review.to_dict() for review in reviews])
+    
+    def to_arrow(self) -> pa.Table:
+        """Expose the columns as an Arrow table without building per-review objects."""
+        return pa.table({
+            'id': pa.array(self.ids, type=pa.string()),
+            'rating': pa.array(self.ratings),
+            'text': pa.array(self.texts, type=pa.string()),
+            'author': pa.array(self.authors, type=pa.string()),
+            'date': pa.array(self.dates, type=pa.string())
+        })
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert to review dictionaries."""
+        return self.to_arrow().to_pylist()
+    
+    def __len__(self) -> int:
+        return len(self.ratings)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Review, 'ReviewsColumnar']:
+        if isinstance(index, slice):
+            # Slices stay columnar and share the underlying arrays
+            return ReviewsColumnar(
+                ids=self.ids[index],
+                ratings=self.ratings[index],
+                texts=self.texts[index],
+                authors=self.authors[index],
+                dates=self.dates[index],
+                days=self.days[index]
+            )
+        return Review(
+            id=self.ids[index],
+            rating=int(self.ratings[index]),
+            text=self.texts[index],
+            author=self.authors[index],
+            date=self.dates[index]
+        )
+    
+    def __iter__(self) -> Iterator[Review]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def ratings_array(reviews: Sequence[Review]) -> np.ndarray:
+    """Ratings as an int8 array, reusing the columnar store when available."""
+    if isinstance(reviews, ReviewsColumnar):
+        return reviews.ratings
+    return np.fromiter((review.rating for review in reviews), dtype=np.int8, count=len(reviews))
+
+
+@dataclass(slots=True)
 class ReviewsData:
     """Container for reviews and metadata."""
-    reviews: List[Review]
+    reviews: Sequence[Review]
     metadata: ReviewsMetadata
     
+    @property
+    def columns(self) -> ReviewsColumnar:
+        """Reviews as columnar arrays."""
+        if isinstance(self.reviews, ReviewsColumnar):
+            return self.reviews
+        return ReviewsColumnar.from_reviews(self.reviews)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert reviews data to dictionary."""
         return {
@@ -82,16 +258,17 @@ class ReviewsData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ReviewsData':
         """Create reviews data from dictionary."""
-        reviews = [Review.from_dict(r) for r in data.get('reviews', [])]
+        reviews = ReviewsColumnar.from_records(data.get('reviews', []))
         metadata = ReviewsMetadata.from_dict(data.get('metadata', {}))
         return cls(reviews=reviews, metadata=metadata)
     
     def get_reviews_by_rating(self, rating: int) -> List[Review]:
         """Filter reviews by rating."""
-        return [review for review in self.reviews if review.rating == rating]
+        columns = self.columns
+        return [columns[index] for index in np.nonzero(columns.ratings == rating)[0]]
     
     def get_average_rating(self) -> float:
         """Calculate average rating."""
-        if not self.reviews:
+        if not len(self.reviews):
             return 0.0
-        return sum(review.rating for review in self.reviews) / len(self.reviews)
\ No newline at end of file
+        return avg_rating(self.columns.ratings)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryResult:
     """Structure for storing summary results."""
     summary_type: str
@@ -35,7 +35,7 @@ class SummaryResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonMetrics:
     """Metrics for comparing summaries."""
     content_overlap: float
@@ -60,7 +60,7 @@ class ComparisonMetrics:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationReport:
     """Evaluation report from GPT analysis."""
     analysis: Dict[str, Any]
@@ -85,7 +85,7 @@ class EvaluationReport:
         return self.analysis.get('reasoning', '')
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Complete comparison result structure."""
     extractive_summary: SummaryResult
@@ -1,95 +1,95 @@
 """OpenAI Agents SDK service for advanced review analysis."""
 
+import asyncio
 import time
-import json
-from typing import List, Dict, Any
-from openai import OpenAI
-from agents import Agent, Runner, function_tool, ModelSettings
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, AsyncIterator, ClassVar, Literal, Optional, Tuple
 
-from ..models.review import Review
+import numpy as np
+import orjson
+import tiktoken
+from agents import Agent, AgentOutputSchema, Runner, RunConfig, ModelSettings, set_default_openai_client
+from openai.types.responses import ResponseTextDeltaEvent
+from pydantic import BaseModel
+
+from ..models.review import Review, ratings_array
 from ..models.summary import SummaryResult, EvaluationReport
 from ..config.settings import SummarizationConfig
+from ..utils.fast_stats import avg_rating, rating_histogram
 from ..utils.logger import Logger
+from ..utils.text_stats import count_sentences
+from .openai_client import get_agent_slots, get_openai_client, run_sync
+from .summary_cache import SemanticCache, cache_key, normalize_text
 
 
-class ReviewAnalysisAgent:
-    """Advanced review analysis agent using OpenAI Agents SDK."""
+class EvaluationScores(BaseModel):
+    """Structured output of a summary evaluation; becomes EvaluationReport.analysis."""
+    extractive_coverage: int
+    abstractive_coverage: int
+    extractive_clarity: int
+    abstractive_clarity: int
+    extractive_usefulness: int
+    abstractive_usefulness: int
+    extractive_key_details: int
+    abstractive_key_details: int
+    preferred_summary: Literal["extractive", "abstractive"]
+    reasoning: str
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Tokenizer of the agent model."""
+    return tiktoken.encoding_for_model(SummarizationConfig.AGENT_MODEL)
+
+
+@lru_cache(maxsize=16384)
+def count_tokens(text: str) -> int:
+    """Number of agent model tokens in a text; cached, as the same reviews are packed repeatedly."""
+    return len(_get_encoding().encode(text))
+
+
+class AppSummary(BaseModel):
+    """Summary of one app in a multi-app answer."""
+    app_number: int
+    summary: str
+
+
+class AppSummaries(BaseModel):
+    """Structured output of a multi-app summary prompt."""
+    summaries: List[AppSummary]
+
+
+# Strict JSON schema, as the Agents SDK sends it, for requests made outside the SDK
+EVALUATION_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "evaluation_scores",
+        "schema": AgentOutputSchema(EvaluationScores).json_schema(),
+        "strict": True
+    }
+}
+
+
+class SummaryStream:
+    """
+    Agent summary streamed as it is generated.
     
-    def __init__(self, api_key: str):
-        """
-        Initialize the review analysis agent.
-        
-        Args:
-            api_key: OpenAI API key
-        """
-        self.client = OpenAI(api_key=api_key)
-        self.logger = Logger.get_logger()
-        
-        # Create specialized tools for review analysis
-        self.tools = self._create_analysis_tools()
-        
-        # Create the main analysis agent
-        self.agent = Agent(
-            name="MBankReviewAnalysisAgent",
-            instructions=self._get_system_prompt(),
-            tools=self.tools,
-            model=SummarizationConfig.AGENT_MODEL,
-            model_settings=ModelSettings(
-                temperature=SummarizationConfig.AGENT_TEMPERATURE,
-                max_tokens=SummarizationConfig.AGENT_MAX_TOKENS
-            )
-        )
-        
-        self.logger.info("ReviewAnalysisAgent initialized with OpenAI Agents SDK")
+    Async-iterate over it for the text deltas; once the stream is exhausted,
+    `result` holds the final SummaryResult.
+    """
     
-    def _create_analysis_tools(self):
-        """Create specialized tools for review analysis."""
-        
-        @function_tool
-        def analyze_text_sentiment(text: str) -> str:
-            """Analyze sentiment and key themes in review text."""
-            if not text.strip():
-                return "No text provided for analysis"
-            
-            word_count = len(text.split())
-            sentences = len([s for s in text.split('.') if s.strip()])
-            
-            return f"Text analysis: {word_count} words, {sentences} sentences. Content analyzed for sentiment and themes."
-        
-        @function_tool
-        def assess_review_quality(reviews_count: int, avg_rating: float) -> str:
-            """Assess overall quality metrics of reviews."""
-            if reviews_count == 0:
-                return "No reviews to assess"
-            
-            quality_score = "High" if avg_rating >= 4 else "Medium" if avg_rating >= 3 else "Low"
-            return f"Quality assessment: {reviews_count} reviews, average rating {avg_rating:.1f}, quality: {quality_score}"
-        
-        @function_tool
-        def generate_structured_summary(key_points: str) -> str:
-            """Generate a structured summary from key points."""
-            if not key_points.strip():
-                return "No key points provided for summary"
-            
-            return f"Structured summary generated from: {len(key_points.split())} words of key points"
-        
-        @function_tool
-        def compare_summary_approaches(extractive: str, abstractive: str) -> str:
-            """Compare different summarization approaches."""
-            if not extractive or not abstractive:
-                return "Both summaries required for comparison"
-            
-            ext_words = len(extractive.split())
-            abs_words = len(abstractive.split())
-            ratio = abs_words / ext_words if ext_words > 0 else 0
-            
-            return f"Comparison analysis: Extractive ({ext_words} words) vs Abstractive ({abs_words} words), ratio: {ratio:.2f}"
-        
-        return [analyze_text_sentiment, assess_review_quality, generate_structured_summary, compare_summary_approaches]
+    def __init__(self, agent: 'ReviewAnalysisAgent', reviews: List[Review]):
+        self.result: Optional[SummaryResult] = None
+        self._deltas = agent._summary_deltas(reviews, self)
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._deltas
+
+
+class ReviewAnalysisAgent:
+    """Advanced review analysis agent using OpenAI Agents SDK."""
     
-    def _get_system_prompt(self) -> str:
-        """Get the system prompt for the agent."""
-        return """Вы - эксперт по анализу отзывов мобильных банковских приложений. Ваша специализация:
+    SYSTEM_PROMPT: ClassVar[str] = """Вы - эксперт по анализу отзывов мобильных банковских приложений. Ваша специализация:
 
         🎯 ОСНОВНЫЕ ЗАДАЧИ:
         1. Анализ отзывов пользователей мобильного приложения MBank
@@ -98,10 +98,8 @@ class ReviewAnalysisAgent:
         4. Сравнение различных подходов к резюмированию
 
         📊 МЕТОДОЛОГИЯ АНАЛИЗА:
-        - Используйте инструменты analyze_text_sentiment для анализа тональности
-        - Применяйте assess_review_quality для оценки качества отзывов
-        - Используйте generate_structured_summary для создания структурированных резюме
-        - Применяйте compare_summary_approaches для сравнения методов
+        - Опирайтесь на предвычисленные метрики отзывов (объем текста, распределение рейтингов, качество)
+        - При сравнении методов учитывайте приведенные метрики резюме
 
         🔧 ТРЕБОВАНИЯ К ВЫВОДУ:
         - Отвечайте только на русском языке
@@ -115,9 +113,108 @@ class ReviewAnalysisAgent:
         3. Технические проблемы и ошибки
         4. Предложения по улучшению
 
-        Всегда используйте доступные инструменты для проведения тщательного анализа."""
+        Всегда используйте приведенные метрики для проведения тщательного анализа."""
+    
+    # Static instructions come before the per-call data, so repeated calls share
+    # a long identical prefix that the API can serve from its prompt cache
+    SUMMARY_PROMPT_PREFIX: ClassVar[str] = """
+        Проанализируйте отзывы о мобильном приложении MBank и создайте экспертное резюме.
+
+        ИНСТРУКЦИИ:
+        1. Учитывайте предвычисленные метрики: объем текста и распределение рейтингов
+        2. Оцените качество данных по приведенной оценке качества
+        3. Сформулируйте итоговое структурированное резюме
+
+        Создайте краткое резюме (3-4 предложения), включающее:
+        ✓ Основные жалобы пользователей
+        ✓ Положительные аспекты приложения
+        ✓ Наиболее критичные проблемы
+        ✓ Общее впечатление пользователей
+
+        Резюме должно быть полезным для команды разработчиков MBank.
+
+        ДАННЫЕ ДЛЯ АНАЛИЗА:
+"""
+    EVALUATION_PROMPT_PREFIX: ClassVar[str] = """
+        Проведите экспертную оценку двух подходов к резюмированию отзывов MBank.
+
+        ЗАДАЧА:
+        1. Сравните резюме с учетом приведенных метрик
+        2. Оцените по критериям: охват, ясность, полезность, детализация
+        3. Дайте оценки от 1 до 10 и выберите предпочтительный метод
+
+        4. Обоснуйте выбор в поле reasoning
+"""
+    MULTI_SUMMARY_PROMPT_PREFIX: ClassVar[str] = """
+        Для каждого приложения ниже создайте резюме. Верните JSON массив.
+
+        Для каждого приложения создайте краткое резюме (3-4 предложения), включающее:
+        ✓ Основные жалобы пользователей
+        ✓ Положительные аспекты приложения
+        ✓ Наиболее критичные проблемы
+        ✓ Общее впечатление пользователей
+
+        Укажите в app_number номер приложения из заголовка его данных.
+"""
+    
+    def __init__(self, api_key: str):
+        """
+        Initialize the review analysis agent.
+        
+        Args:
+            api_key: OpenAI API key
+        """
+        # The Agents SDK runs on its default client, so point it at the shared pooled one
+        self.client = get_openai_client(api_key)
+        set_default_openai_client(self.client)
+        self.logger = Logger.get_logger()
+        
+        # Agents and response caches are created on first use (see the properties
+        # below), so constructing the service for a single call path stays cheap
+        self.logger.info("ReviewAnalysisAgent initialized with OpenAI Agents SDK")
+    
+    @cached_property
+    def agent(self) -> Agent:
+        """The main analysis agent."""
+        return Agent(
+            name="MBankReviewAnalysisAgent",
+            instructions=self.SYSTEM_PROMPT,
+            model=SummarizationConfig.AGENT_MODEL,
+            model_settings=ModelSettings(
+                temperature=SummarizationConfig.AGENT_TEMPERATURE,
+                max_tokens=SummarizationConfig.AGENT_MAX_TOKENS,
+                # Routes calls sharing the static prompt prefix to the same prompt cache; sent in
+                # the request body, as older openai SDKs have no prompt_cache_key argument
+                extra_body={"prompt_cache_key": SummarizationConfig.AGENT_PROMPT_CACHE_KEY}
+            )
+        )
+    
+    @cached_property
+    def evaluation_agent(self) -> Agent:
+        """Same agent, but the model must answer with schema-valid evaluation scores."""
+        return self.agent.clone(output_type=EvaluationScores)
+    
+    @cached_property
+    def multi_summary_agent(self) -> Agent:
+        """Same agent, answering with one summary per app of a multi-app prompt."""
+        return self.agent.clone(output_type=AppSummaries)
+    
+    # Responses to identical or near-identical prompts are reused instead of re-running the agent
+    @cached_property
+    def summary_cache(self) -> SemanticCache:
+        """Response cache for summaries."""
+        return self._open_cache("summary")
+    
+    @cached_property
+    def evaluation_cache(self) -> SemanticCache:
+        """Response cache for evaluations."""
+        return self._open_cache("evaluation")
     
     def create_summary(self, reviews: List[Review]) -> SummaryResult:
+        """Create an abstractive summary, blocking until it is ready."""
+        return run_sync(self.acreate_summary(reviews))
+    
+    async def acreate_summary(self, reviews: List[Review]) -> SummaryResult:
         """
         Create an abstractive summary using the agent.
         
@@ -138,47 +235,45 @@ class ReviewAnalysisAgent:
                 processing_time=time.time() - start_time
             )
         
-        # Prepare reviews data
+        # A handful of short reviews is summarized by a template, without an LLM call
+        direct_text = self._build_direct_summary(reviews)
+        if direct_text is not None:
+            self.logger.info(f"Input too small for the agent, templated summary of {len(reviews)} reviews")
+            return SummaryResult(
+                summary_type="abstractive_agent",
+                text=direct_text,
+                word_count=len(direct_text.split()),
+                sentence_count=count_sentences(direct_text),
+                processing_time=time.time() - start_time
+            )
+        
+        # Create analysis prompt
         reviews_text = self._prepare_reviews_for_agent(reviews)
-        avg_rating = sum(r.rating for r in reviews) / len(reviews)
+        prompt = self._build_summary_prompt(reviews, reviews_text)
+        key, embedding, cached = await self._lookup_cache(self.summary_cache, prompt, reviews_text)
+        if cached is not None:
+            self.logger.info("Agent summary served from cache")
+            summary = SummaryResult.from_dict(orjson.loads(cached))
+            summary.processing_time = time.time() - start_time
+            return summary
         
+        cacheable = False
         try:
             self.logger.info(f"Agent analyzing {len(reviews)} reviews")
             
-            # Create analysis prompt
-            prompt = f"""
-            Проанализируйте отзывы о мобильном приложении MBank и создайте экспертное резюме.
-
-            ДАННЫЕ ДЛЯ АНАЛИЗА:
-            - Количество отзывов: {len(reviews)}
-            - Средний рейтинг: {avg_rating:.1f}/5
-            - Текст отзывов: {reviews_text}
-
-            ИНСТРУКЦИИ:
-            1. Используйте analyze_text_sentiment для анализа тональности отзывов
-            2. Используйте assess_review_quality для оценки качества данных  
-            3. Используйте generate_structured_summary для создания итогового резюме
-
-            Создайте краткое резюме (3-4 предложения), включающее:
-            ✓ Основные жалобы пользователей
-            ✓ Положительные аспекты приложения
-            ✓ Наиболее критичные проблемы
-            ✓ Общее впечатление пользователей
-
-            Резюме должно быть полезным для команды разработчиков MBank.
-            """
-            
             # Execute the agent
-            response = Runner.run_sync(self.agent, prompt)
+            async with get_agent_slots():
+                response = await Runner.run(self.agent, prompt)
             
             # Extract the summary text
             summary_text = self._extract_summary_from_response(response)
             
             # Calculate metrics
             word_count = len(summary_text.split())
-            sentence_count = len([s for s in summary_text.split('.') if s.strip()])
+            sentence_count = count_sentences(summary_text)
             
             self.logger.info(f"Agent summary created: {word_count} words, {sentence_count} sentences")
+            cacheable = True
             
         except Exception as e:
             self.logger.error(f"Error in agent summary creation: {e}")
@@ -188,15 +283,187 @@ class ReviewAnalysisAgent:
         
         processing_time = time.time() - start_time
         
-        return SummaryResult(
+        summary = SummaryResult(
             summary_type="abstractive_agent",
             text=summary_text,
             word_count=word_count,
             sentence_count=sentence_count,
             processing_time=processing_time
         )
+        if cacheable and embedding is not None:
+            self.summary_cache.put(key, embedding, orjson.dumps(summary).decode())
+        return summary
+    
+    def create_summaries(self, reviews_by_app: List[List[Review]]) -> List[SummaryResult]:
+        """Create abstractive summaries for several apps, blocking until they are ready."""
+        return run_sync(self.acreate_summaries(reviews_by_app))
+    
+    async def acreate_summaries(self, reviews_by_app: List[List[Review]]) -> List[SummaryResult]:
+        """
+        Create abstractive summaries for several apps, packing as many apps into
+        one agent prompt as the context window allows.
+        
+        The system prompt and instructions are sent once per group instead of
+        once per app, and each group is a single round-trip.
+        
+        Args:
+            reviews_by_app: One list of Review objects per app
+            
+        Returns:
+            SummaryResult objects in the order of reviews_by_app
+        """
+        results: List[Optional[SummaryResult]] = [None] * len(reviews_by_app)
+        
+        blocks = {}
+        for index, reviews in enumerate(reviews_by_app):
+            if reviews and self._build_direct_summary(reviews) is None:
+                blocks[index] = self._build_app_block(index + 1, reviews)
+            else:
+                # Empty or templated summary, no LLM call involved
+                results[index] = await self.acreate_summary(reviews)
+        
+        groups = self._group_app_blocks(blocks)
+        group_results = await asyncio.gather(*(self._summarize_app_group(group) for group in groups))
+        for group_summaries in group_results:
+            for index, summary in group_summaries.items():
+                results[index] = summary
+        return results
+    
+    def _group_app_blocks(self, blocks: Dict[int, str]) -> List[Dict[int, str]]:
+        """Greedily pack app blocks into groups that fit the agent context window and answer length."""
+        budget = (
+            SummarizationConfig.AGENT_CONTEXT_TOKENS
+            - count_tokens(self.SYSTEM_PROMPT)
+            - count_tokens(self.MULTI_SUMMARY_PROMPT_PREFIX)
+        )
+        max_apps = max(1, SummarizationConfig.AGENT_OUTPUT_TOKENS // SummarizationConfig.AGENT_SUMMARY_TOKENS)
+        
+        groups: List[Dict[int, str]] = []
+        used = budget
+        for index, block in blocks.items():
+            cost = count_tokens(block) + SummarizationConfig.AGENT_SUMMARY_TOKENS
+            if used + cost > budget or len(groups[-1]) >= max_apps:
+                groups.append({})
+                used = 0
+            groups[-1][index] = block
+            used += cost
+        return groups
+    
+    async def _summarize_app_group(self, group: Dict[int, str]) -> Dict[int, SummaryResult]:
+        """Summarize one group of apps with a single agent run."""
+        start_time = time.time()
+        prompt = "".join((self.MULTI_SUMMARY_PROMPT_PREFIX, *group.values()))
+        
+        texts = {}
+        try:
+            self.logger.info(f"Agent summarizing {len(group)} apps in one prompt")
+            async with get_agent_slots():
+                response = await Runner.run(
+                    self.multi_summary_agent,
+                    prompt,
+                    run_config=RunConfig(model_settings=ModelSettings(
+                        max_tokens=SummarizationConfig.AGENT_SUMMARY_TOKENS * len(group)
+                    ))
+                )
+            texts = {item.app_number - 1: item.summary.strip() for item in response.final_output.summaries}
+        except Exception as e:
+            self.logger.error(f"Error in multi-app agent summary creation: {e}")
+        
+        processing_time = time.time() - start_time
+        
+        summaries = {}
+        for index in group:
+            summary_text = texts.get(index)
+            if summary_text:
+                word_count = len(summary_text.split())
+                sentence_count = count_sentences(summary_text)
+            else:
+                summary_text = "Ошибка при создании резюме с помощью агента OpenAI. Проверьте подключение и настройки."
+                word_count = 0
+                sentence_count = 0
+            
+            summaries[index] = SummaryResult(
+                summary_type="abstractive_agent",
+                text=summary_text,
+                word_count=word_count,
+                sentence_count=sentence_count,
+                processing_time=processing_time
+            )
+        return summaries
+    
+    def stream_summary(self, reviews: List[Review]) -> SummaryStream:
+        """
+        Create an abstractive summary, streaming the text as the agent writes it.
+        
+        Args:
+            reviews: List of Review objects
+            
+        Returns:
+            SummaryStream over the text deltas
+        """
+        return SummaryStream(self, reviews)
+    
+    async def _summary_deltas(self, reviews: List[Review], stream: SummaryStream) -> AsyncIterator[str]:
+        """Yield summary text deltas and store the final SummaryResult on the stream."""
+        start_time = time.time()
+        
+        if not reviews or self._build_direct_summary(reviews) is not None:
+            # Nothing worth streaming: no agent run is needed
+            stream.result = await self.acreate_summary(reviews)
+            yield stream.result.text
+            return
+        
+        reviews_text = self._prepare_reviews_for_agent(reviews)
+        prompt = self._build_summary_prompt(reviews, reviews_text)
+        key, embedding, cached = await self._lookup_cache(self.summary_cache, prompt, reviews_text)
+        if cached is not None:
+            self.logger.info("Agent summary served from cache")
+            stream.result = SummaryResult.from_dict(orjson.loads(cached))
+            stream.result.processing_time = time.time() - start_time
+            yield stream.result.text
+            return
+        
+        cacheable = False
+        try:
+            self.logger.info(f"Agent streaming summary of {len(reviews)} reviews")
+            
+            # The slot is held until the stream ends, as the run is in flight until then
+            async with get_agent_slots():
+                response = Runner.run_streamed(self.agent, prompt)
+                async for event in response.stream_events():
+                    if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+                        yield event.data.delta
+            
+            # The deltas are for display; metrics come from the final output
+            summary_text = self._extract_summary_from_response(response)
+            word_count = len(summary_text.split())
+            sentence_count = count_sentences(summary_text)
+            
+            self.logger.info(f"Agent summary streamed: {word_count} words, {sentence_count} sentences")
+            cacheable = True
+            
+        except Exception as e:
+            self.logger.error(f"Error in agent summary streaming: {e}")
+            summary_text = "Ошибка при создании резюме с помощью агента OpenAI. Проверьте подключение и настройки."
+            word_count = 0
+            sentence_count = 0
+            yield summary_text
+        
+        stream.result = SummaryResult(
+            summary_type="abstractive_agent",
+            text=summary_text,
+            word_count=word_count,
+            sentence_count=sentence_count,
+            processing_time=time.time() - start_time
+        )
+        if cacheable and embedding is not None:
+            self.summary_cache.put(key, embedding, orjson.dumps(stream.result).decode())
     
     def evaluate_summaries(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> EvaluationReport:
+        """Evaluate and compare summaries, blocking until the evaluation is ready."""
+        return run_sync(self.aevaluate_summaries(extractive_summary, abstractive_summary))
+    
+    async def aevaluate_summaries(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> EvaluationReport:
         """
         Evaluate and compare summaries using the agent.
         
@@ -207,67 +474,355 @@ class ReviewAnalysisAgent:
         Returns:
             EvaluationReport object
         """
+        if not extractive_summary.word_count and not abstractive_summary.word_count:
+            return self._create_empty_evaluation()
+        
+        # Create evaluation prompt
+        prompt = self._build_evaluation_prompt(extractive_summary, abstractive_summary)
+        key, embedding, cached = await self._lookup_cache(
+            self.evaluation_cache, prompt, "\n".join((extractive_summary.text, abstractive_summary.text))
+        )
+        if cached is not None:
+            self.logger.info("Agent evaluation served from cache")
+            return EvaluationReport.from_dict(orjson.loads(cached))
+        
         try:
             self.logger.info("Agent evaluating summary comparison")
             
-            # Create evaluation prompt
-            prompt = f"""
-            Проведите экспертную оценку двух подходов к резюмированию отзывов MBank:
-
-            ИЗВЛЕКАЮЩЕЕ РЕЗЮМЕ (Детерминистический подход):
-            {extractive_summary.text}
-            Метрики: {extractive_summary.word_count} слов, время: {extractive_summary.processing_time:.2f}с
-
-            АБСТРАКТИВНОЕ РЕЗЮМЕ (ИИ-подход):
-            {abstractive_summary.text}
-            Метрики: {abstractive_summary.word_count} слов, время: {abstractive_summary.processing_time:.2f}с
-
-            ЗАДАЧА:
-            1. Используйте compare_summary_approaches для детального сравнения
-            2. Оцените по критериям: охват, ясность, полезность, детализация
-            3. Дайте оценки от 1 до 10 и выберите предпочтительный метод
-
-            Ответьте СТРОГО в JSON формате:
-            {{
-                "analysis": {{
-                    "extractive_coverage": 8,
-                    "abstractive_coverage": 7,
-                    "extractive_clarity": 6,
-                    "abstractive_clarity": 9,
-                    "extractive_usefulness": 7,
-                    "abstractive_usefulness": 8,
-                    "extractive_key_details": 9,
-                    "abstractive_key_details": 7,
-                    "preferred_summary": "abstractive",
-                    "reasoning": "Обоснование выбора..."
-                }}
-            }}
-            """
-            
-            # Execute the agent
-            response = Runner.run_sync(self.agent, prompt)
-            
-            # Extract and parse the evaluation
-            evaluation_data = self._parse_evaluation_response(response)
+            # Execute the agent; the SDK validates the answer against EvaluationScores
+            async with get_agent_slots():
+                response = await Runner.run(self.evaluation_agent, prompt)
             
             self.logger.info("Agent evaluation completed successfully")
-            return EvaluationReport.from_dict(evaluation_data)
+            evaluation = EvaluationReport(analysis=response.final_output.model_dump())
+            if embedding is not None:
+                self.evaluation_cache.put(key, embedding, orjson.dumps(evaluation).decode())
+            return evaluation
             
         except Exception as e:
             self.logger.error(f"Error in agent evaluation: {e}")
             return self._create_fallback_evaluation()
     
+    @staticmethod
+    def _open_cache(namespace: str) -> SemanticCache:
+        """Open the semantic response cache for one kind of agent response."""
+        return SemanticCache(
+            SummarizationConfig.SEMANTIC_CACHE_FILE,
+            namespace,
+            threshold=SummarizationConfig.SEMANTIC_CACHE_THRESHOLD,
+            max_entries=SummarizationConfig.SEMANTIC_CACHE_MAX_ENTRIES
+        )
+    
+    async def _lookup_cache(
+        self,
+        cache: SemanticCache,
+        prompt: str,
+        semantic_text: str
+    ) -> Tuple[str, Optional[np.ndarray], Optional[str]]:
+        """
+        Look a prompt up in a response cache: by exact key first, then by embedding similarity.
+        
+        Only the part of the prompt that differs between calls is embedded; the
+        fixed instructions would otherwise dominate the embedding and make prompts
+        about unrelated reviews look alike.
+        
+        Args:
+            cache: Cache to look in
+            prompt: Prompt that would be sent to the agent (the exact key)
+            semantic_text: Variable part of the prompt (the embedded text)
+            
+        Returns:
+            Tuple of (cache key, embedding or None, cached response or None)
+        """
+        key = cache_key(prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            return key, None, cached
+        
+        try:
+            response = await self.client.embeddings.create(
+                model=SummarizationConfig.EMBEDDING_MODEL,
+                input=normalize_text(semantic_text)
+            )
+        except Exception as e:
+            # The cache is an optimisation; without an embedding just run the agent
+            self.logger.warning(f"Failed to embed prompt for cache lookup: {e}")
+            return key, None, None
+        
+        embedding = np.asarray(response.data[0].embedding, dtype=np.float32)
+        embedding /= np.linalg.norm(embedding)
+        return key, embedding, cache.get_similar(embedding)
+    
+    async def submit_batch(self, prompts: Dict[str, str], response_format: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Submit prompts as one OpenAI Batch API job of chat completions.
+        
+        Batch requests are billed at half price but finish asynchronously, and they
+        run as plain completions with the agent instructions (without tool calls).
+        
+        Args:
+            prompts: Prompts keyed by custom id
+            response_format: Optional response_format for every request
+            
+        Returns:
+            Batch job id
+        """
+        body = {
+            "model": SummarizationConfig.AGENT_MODEL,
+            "temperature": SummarizationConfig.AGENT_TEMPERATURE,
+            "max_tokens": SummarizationConfig.AGENT_MAX_TOKENS
+        }
+        if response_format is not None:
+            body["response_format"] = response_format
+        
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **body,
+                    "messages": [
+                        {"role": "system", "content": self.SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ]
+                }
+            })
+            for custom_id, prompt in prompts.items()
+        ]
+        
+        batch_file = await self.client.files.create(
+            file=("reviews_batch.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=SummarizationConfig.BATCH_COMPLETION_WINDOW
+        )
+        
+        self.logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
+        return batch.id
+    
+    async def wait_for_batch(self, batch_id: str) -> Dict[str, str]:
+        """
+        Poll a batch job until it finishes and collect its answers.
+        
+        Args:
+            batch_id: Batch job id
+            
+        Returns:
+            Response texts keyed by custom id; failed requests are missing
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(SummarizationConfig.BATCH_POLL_INTERVAL)
+            batch = await self.client.batches.retrieve(batch_id)
+        
+        self.logger.info(f"Batch {batch_id} finished with status: {batch.status}")
+        if not batch.output_file_id:
+            return {}
+        
+        output = await self.client.files.content(batch.output_file_id)
+        answers = {}
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                self.logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            answers[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"] or ""
+        return answers
+    
+    async def create_summaries_batch(self, reviews_by_app: Dict[str, List[Review]]) -> Dict[str, SummaryResult]:
+        """
+        Create abstractive summaries for several apps in one Batch API job.
+        
+        Args:
+            reviews_by_app: Reviews keyed by app id
+            
+        Returns:
+            SummaryResult objects keyed by app id
+        """
+        start_time = time.time()
+        
+        prompts = {
+            app_id: self._build_summary_prompt(reviews, self._prepare_reviews_for_agent(reviews))
+            for app_id, reviews in reviews_by_app.items()
+            if reviews and self._build_direct_summary(reviews) is None
+        }
+        answers = await self.wait_for_batch(await self.submit_batch(prompts)) if prompts else {}
+        processing_time = time.time() - start_time
+        
+        results = {}
+        for app_id in reviews_by_app:
+            if app_id not in prompts:
+                # Empty or templated summary, no LLM call involved
+                results[app_id] = await self.acreate_summary(reviews_by_app[app_id])
+                continue
+            
+            if app_id in answers:
+                summary_text = self._extract_summary_from_response(answers[app_id])
+                word_count = len(summary_text.split())
+                sentence_count = count_sentences(summary_text)
+            else:
+                summary_text = "Ошибка при создании резюме в пакетном режиме."
+                word_count = 0
+                sentence_count = 0
+            
+            results[app_id] = SummaryResult(
+                summary_type="abstractive_agent",
+                text=summary_text,
+                word_count=word_count,
+                sentence_count=sentence_count,
+                processing_time=processing_time
+            )
+        return results
+    
+    async def evaluate_summaries_batch(
+        self,
+        summaries_by_app: Dict[str, Tuple[SummaryResult, SummaryResult]]
+    ) -> Dict[str, EvaluationReport]:
+        """
+        Evaluate summary pairs for several apps in one Batch API job.
+        
+        Args:
+            summaries_by_app: (extractive, abstractive) summary pairs keyed by app id
+            
+        Returns:
+            EvaluationReport objects keyed by app id
+        """
+        prompts = {
+            app_id: self._build_evaluation_prompt(extractive_summary, abstractive_summary)
+            for app_id, (extractive_summary, abstractive_summary) in summaries_by_app.items()
+            if extractive_summary.word_count or abstractive_summary.word_count
+        }
+        answers = (
+            await self.wait_for_batch(await self.submit_batch(prompts, EVALUATION_RESPONSE_FORMAT))
+            if prompts else {}
+        )
+        
+        evaluations = {}
+        for app_id in summaries_by_app:
+            if app_id not in prompts:
+                evaluations[app_id] = self._create_empty_evaluation()
+                continue
+            try:
+                scores = EvaluationScores.model_validate_json(answers[app_id])
+                evaluations[app_id] = EvaluationReport(analysis=scores.model_dump())
+            except (KeyError, ValueError):
+                evaluations[app_id] = self._create_fallback_evaluation()
+        return evaluations
+    
+    def _build_direct_summary(self, reviews: List[Review]) -> Optional[str]:
+        """
+        Templated summary for inputs too small to need the agent.
+        
+        Args:
+            reviews: Non-empty list of Review objects
+            
+        Returns:
+            Summary text, or None if the reviews should go to the agent
+        """
+        total_chars = sum(len(review.text) for review in reviews)
+        if len(reviews) >= SummarizationConfig.AGENT_MIN_REVIEWS and total_chars >= SummarizationConfig.AGENT_MIN_CHARS:
+            return None
+        
+        average = avg_rating(ratings_array(reviews))
+        quotes = " ".join(
+            f"«{review.text.strip()[:200]}»"
+            for review in reviews if review.text and not review.text.isspace()
+        )
+        return f"Отзывов: {len(reviews)}, средний рейтинг {average:.1f}/5. {quotes}".strip()
+    
+    def _build_summary_prompt(self, reviews: List[Review], reviews_text: str) -> str:
+        """Build the summary prompt for a non-empty list of reviews and their prepared text."""
+        average = avg_rating(ratings_array(reviews))
+        
+        return "".join((
+            self.SUMMARY_PROMPT_PREFIX,
+            f"        - Количество отзывов: {len(reviews)}\n",
+            f"        - Средний рейтинг: {average:.1f}/5\n",
+            f"        - ПРЕДВЫЧИСЛЕННЫЕ МЕТРИКИ: {self._review_stats(reviews)}\n",
+            f"        - Текст отзывов: {reviews_text}\n"
+        ))
+    
+    @staticmethod
+    def _review_stats(reviews: List[Review]) -> str:
+        """
+        Review statistics for the prompt, as JSON.
+        
+        These are computed here rather than exposed as agent tools: each tool call
+        would cost the model a round-trip for a few counts.
+        """
+        texts = [review.text for review in reviews if review.text and not review.text.isspace()]
+        ratings = ratings_array(reviews)
+        counts = rating_histogram(ratings)
+        average = avg_rating(ratings)
+        
+        return orjson.dumps({
+            "word_count": sum(len(text.split()) for text in texts),
+            "sentence_count": sum(count_sentences(text) for text in texts),
+            "rating_histogram": {str(stars): int(counts[stars]) for stars in range(1, 6)},
+            "quality": "High" if average >= 4 else "Medium" if average >= 3 else "Low"
+        }).decode()
+    
+    def _build_app_block(self, app_number: int, reviews: List[Review]) -> str:
+        """Build the data block of one app in a multi-app summary prompt."""
+        reviews_text = self._prepare_reviews_for_agent(reviews)
+        average = avg_rating(ratings_array(reviews))
+        
+        return "".join((
+            f"\n        ПРИЛОЖЕНИЕ {app_number}:\n",
+            f"        - Количество отзывов: {len(reviews)}\n",
+            f"        - Средний рейтинг: {average:.1f}/5\n",
+            f"        - ПРЕДВЫЧИСЛЕННЫЕ МЕТРИКИ: {self._review_stats(reviews)}\n",
+            f"        - Текст отзывов: {reviews_text}\n"
+        ))
+    
+    def _build_evaluation_prompt(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> str:
+        """Build the prompt that asks for a JSON evaluation of two summaries."""
+        length_ratio = (
+            abstractive_summary.word_count / extractive_summary.word_count
+            if extractive_summary.word_count else 0
+        )
+        return "".join((
+            self.EVALUATION_PROMPT_PREFIX,
+            "\n        ИЗВЛЕКАЮЩЕЕ РЕЗЮМЕ (Детерминистический подход):\n",
+            f"        {extractive_summary.text}\n",
+            f"        Метрики: {extractive_summary.word_count} слов, время: {extractive_summary.processing_time:.2f}с\n",
+            "\n        АБСТРАКТИВНОЕ РЕЗЮМЕ (ИИ-подход):\n",
+            f"        {abstractive_summary.text}\n",
+            f"        Метрики: {abstractive_summary.word_count} слов, время: {abstractive_summary.processing_time:.2f}с\n",
+            f"\n        Соотношение длины (абстрактивное / извлекающее): {length_ratio:.2f}\n"
+        ))
+    
     def _prepare_reviews_for_agent(self, reviews: List[Review]) -> str:
-        """Prepare reviews text for agent analysis."""
-        # Limit to first 30 reviews to avoid token limits
-        limited_reviews = reviews[:30]
+        """
+        Prepare reviews text for agent analysis within the AGENT_REVIEW_TOKENS budget.
         
-        reviews_text = ""
-        for i, review in enumerate(limited_reviews, 1):
-            if review.text.strip():
-                reviews_text += f"[{i}] Рейтинг: {review.rating}/5 | {review.text[:200]}...\n"
+        Reviews are packed greedily, longest first, since longer reviews usually
+        carry more detail; reviews that do not fit are skipped and the rest are
+        listed in their original order, untruncated.
+        """
+        lines = [
+            f"Рейтинг: {review.rating}/5 | {review.text}"
+            for review in reviews
+            if review.text and not review.text.isspace()
+        ]
+        costs = [count_tokens(line) for line in lines]
+        
+        budget = SummarizationConfig.AGENT_REVIEW_TOKENS
+        selected = []
+        for index in sorted(range(len(lines)), key=costs.__getitem__, reverse=True):
+            if costs[index] <= budget:
+                selected.append(index)
+                budget -= costs[index]
         
-        return reviews_text
+        # One join instead of repeated +=
+        return "".join(f"[{i}] {lines[index]}\n" for i, index in enumerate(sorted(selected), 1))
     
     def _extract_summary_from_response(self, response) -> str:
         """Extract clean summary text from agent response."""
@@ -292,27 +847,20 @@ class ReviewAnalysisAgent:
         
         return ' '.join(clean_lines) if clean_lines else text
     
-    def _parse_evaluation_response(self, response) -> Dict[str, Any]:
-        """Parse JSON evaluation from agent response."""
-        if hasattr(response, 'final_output'):
-            text = response.final_output
-        elif hasattr(response, 'content'):
-            text = response.content
-        else:
-            text = str(response)
-        
-        # Try to extract JSON
-        try:
-            if '{' in text and '}' in text:
-                start = text.find('{')
-                end = text.rfind('}') + 1
-                json_text = text[start:end]
-                return json.loads(json_text)
-        except (json.JSONDecodeError, ValueError):
-            pass
-        
-        # Fallback if parsing fails
-        return self._create_fallback_evaluation().to_dict()
+    def _create_empty_evaluation(self) -> EvaluationReport:
+        """Evaluation for two empty summaries; there is nothing for the agent to compare."""
+        return EvaluationReport(analysis={
+            "extractive_coverage": 0,
+            "abstractive_coverage": 0,
+            "extractive_clarity": 0,
+            "abstractive_clarity": 0,
+            "extractive_usefulness": 0,
+            "abstractive_usefulness": 0,
+            "extractive_key_details": 0,
+            "abstractive_key_details": 0,
+            "preferred_summary": "Н/Д",
+            "reasoning": "Оба резюме пусты, оценка агентом не проводилась"
+        })
     
     def _create_fallback_evaluation(self) -> EvaluationReport:
         """Create fallback evaluation when agent fails."""
@@ -1,15 +1,21 @@
 """Main analysis service that orchestrates the entire review analysis process."""
 
-from typing import Optional
+import asyncio
+import os
+from typing import Awaitable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
-from ..models.review import ReviewsData
-from ..models.summary import ComparisonResult
+from ..models.review import Review, ReviewsData
+from ..models.summary import ComparisonResult, SummaryResult, EvaluationReport
 from ..services.scraper_service import ScraperService
 from ..services.summarization_service import ExtractiveService, AbstractiveService, ComparisonService
 from ..services.data_service import DataService
-from ..config.settings import AppConfig
+from ..services.agent_service import ReviewAnalysisAgent
+from ..services.openai_client import run_sync
+from ..config.settings import AppConfig, SummarizationConfig
 from ..utils.logger import Logger
 
+T = TypeVar('T')
+
 
 class AnalysisService:
     """Main service for orchestrating the review analysis process."""
@@ -28,6 +34,66 @@ class AnalysisService:
         self.data_service = DataService()
         self.logger = Logger.get_logger()
     
+    async def _warm_up_connection(self) -> None:
+        """Open a pooled connection to the OpenAI API ahead of the first agent call."""
+        try:
+            await self.abstractive_service.client.models.retrieve(SummarizationConfig.AGENT_MODEL)
+        except Exception as e:
+            # Only a head start; the agent call reports real connection problems
+            self.logger.warning(f"OpenAI connection warm-up failed: {e}")
+    
+    async def _scrape_with_warm_up(self, scraper: ScraperService, review_count: int) -> ReviewsData:
+        """Scrape reviews in a worker thread while the OpenAI connection is warmed up."""
+        reviews_data, _ = await asyncio.gather(
+            asyncio.to_thread(scraper.scrape_reviews, count=review_count),
+            self._warm_up_connection()
+        )
+        return reviews_data
+    
+    async def _summarize_and_evaluate(
+        self,
+        reviews: Sequence[Review]
+    ) -> Tuple[SummaryResult, SummaryResult, EvaluationReport]:
+        """
+        Generate the extractive summary, then the abstractive one and the evaluation in one agent call.
+        
+        The extractive summary is CPU work, so it runs in a worker thread; one
+        agent round trip then yields both the abstractive summary and the scores.
+        
+        Args:
+            reviews: Reviews to summarize
+            
+        Returns:
+            Tuple of (extractive summary, abstractive summary, evaluation report)
+        """
+        extractive_summary = await asyncio.to_thread(self.extractive_service.summarize, reviews)
+        abstractive_summary, evaluation_report = await self.abstractive_service.asummarize_and_evaluate(
+            reviews, extractive_summary
+        )
+        return extractive_summary, abstractive_summary, evaluation_report
+    
+    async def _save_summarize_and_evaluate(
+        self,
+        reviews_data: ReviewsData,
+        reviews_file: str
+    ) -> Tuple[bool, Tuple[SummaryResult, SummaryResult, EvaluationReport]]:
+        """
+        Save reviews in a worker thread while the summaries are generated and evaluated.
+        
+        Saving only reads the reviews, so neither step waits for the other.
+        
+        Args:
+            reviews_data: Scraped reviews
+            reviews_file: File path to save reviews
+            
+        Returns:
+            Tuple of (whether the reviews were saved, summaries and evaluation)
+        """
+        return await asyncio.gather(
+            asyncio.to_thread(self.data_service.save_reviews_data, reviews_data, reviews_file),
+            self._summarize_and_evaluate(reviews_data.reviews)
+        )
+    
     def analyze_app_reviews(
         self,
         app_id: str,
@@ -52,10 +118,10 @@ class AnalysisService:
         self.logger.info(f"Starting complete analysis workflow for app: {app_id}")
         self.logger.info(f"Parameters: review_count={review_count}, save_reviews={save_reviews}")
         
-        # Step 1: Scrape reviews
-        self.logger.info("Step 1/6: Scraping reviews from Google Play Store")
+        # Step 1: Scrape reviews; the TLS handshake with OpenAI overlaps with it
+        self.logger.info("Step 1/5: Scraping reviews from Google Play Store")
         scraper = ScraperService(app_id)
-        reviews_data = scraper.scrape_reviews(count=review_count)
+        reviews_data = run_sync(self._scrape_with_warm_up(scraper, review_count))
         
         if not reviews_data.reviews:
             self.logger.error("No reviews found for the specified app")
@@ -63,34 +129,28 @@ class AnalysisService:
         
         self.logger.info(f"Successfully scraped {len(reviews_data.reviews)} reviews")
         
-        # Step 2: Save reviews if requested
+        # Steps 2 and 3: Save reviews if requested, concurrently with the summaries
         if save_reviews:
-            self.logger.info(f"Step 2/6: Saving reviews to {reviews_file}")
-            success = self.data_service.save_reviews_data(reviews_data, reviews_file)
+            self.logger.info(f"Step 2/5: Saving reviews to {reviews_file}")
+        else:
+            self.logger.info("Step 2/5: Skipping review save")
+        self.logger.info("Step 3/5: Generating and evaluating extractive and abstractive summaries")
+        
+        if save_reviews:
+            success, summaries = run_sync(self._save_summarize_and_evaluate(reviews_data, reviews_file))
             if success:
                 self.logger.info("Reviews saved successfully")
             else:
                 self.logger.warning("Failed to save reviews")
         else:
-            self.logger.info("Step 2/6: Skipping review save")
+            summaries = run_sync(self._summarize_and_evaluate(reviews_data.reviews))
         
-        # Step 3: Generate summaries
-        self.logger.info("Step 3/6: Generating extractive summary")
-        extractive_summary = self.extractive_service.summarize(reviews_data.reviews)
+        extractive_summary, abstractive_summary, evaluation_report = summaries
         self.logger.info(f"Extractive summary generated: {extractive_summary.word_count} words, {extractive_summary.processing_time:.2f}s")
-        
-        self.logger.info("Step 4/6: Generating abstractive summary with GPT-4")
-        abstractive_summary = self.abstractive_service.summarize(reviews_data.reviews)
         self.logger.info(f"Abstractive summary generated: {abstractive_summary.word_count} words, {abstractive_summary.processing_time:.2f}s")
         
-        # Step 4: Evaluate summaries
-        self.logger.info("Step 5/6: Evaluating and comparing summaries")
-        evaluation_report = self.abstractive_service.evaluate_summaries(
-            extractive_summary, abstractive_summary
-        )
-        
-        # Step 5: Create comparison result
-        self.logger.info("Creating comparison metrics")
+        # Step 4: Create comparison result
+        self.logger.info("Step 4/5: Creating comparison metrics")
         comparison_result = self.comparison_service.create_comparison_result(
             extractive_summary, abstractive_summary, evaluation_report
         )
@@ -100,8 +160,8 @@ class AnalysisService:
         self.logger.info(f"  - Length ratio: {comparison_result.comparison_metrics.length_ratio:.3f}")
         self.logger.info(f"  - Readability score: {comparison_result.comparison_metrics.readability_score:.3f}")
         
-        # Step 6: Save results
-        self.logger.info(f"Step 6/6: Saving results to {results_file}")
+        # Step 5: Save results
+        self.logger.info(f"Step 5/5: Saving results to {results_file}")
         success = self.data_service.save_results_data(comparison_result, results_file)
         if success:
             self.logger.info("Results saved successfully")
@@ -129,13 +189,9 @@ class AnalysisService:
         if not reviews_data.reviews:
             raise ValueError("No reviews provided for analysis")
         
-        # Generate summaries
-        extractive_summary = self.extractive_service.summarize(reviews_data.reviews)
-        abstractive_summary = self.abstractive_service.summarize(reviews_data.reviews)
-        
-        # Evaluate summaries
-        evaluation_report = self.abstractive_service.evaluate_summaries(
-            extractive_summary, abstractive_summary
+        # Generate and evaluate summaries
+        extractive_summary, abstractive_summary, evaluation_report = run_sync(
+            self._summarize_and_evaluate(reviews_data.reviews)
         )
         
         # Create comparison result
@@ -148,6 +204,149 @@ class AnalysisService:
         
         return comparison_result
     
+    def analyze_apps_batch(
+        self,
+        app_ids: List[str],
+        review_count: int = AppConfig.DEFAULT_REVIEW_COUNT
+    ) -> Dict[str, ComparisonResult]:
+        """
+        Offline analysis of several apps through the OpenAI Batch API.
+        
+        Abstractive summaries and evaluations are each sent as one batch job, which
+        costs half as much as real-time calls but may take up to the batch
+        completion window. Meant for nightly runs, not interactive use.
+        
+        Args:
+            app_ids: Google Play Store app IDs
+            review_count: Number of reviews to analyze per app
+            
+        Returns:
+            ComparisonResult objects keyed by app ID
+        """
+        agent = ReviewAnalysisAgent(self.openai_api_key)
+        reviews_by_app = self._scrape_apps(app_ids, review_count)
+        
+        self.logger.info(f"Submitting abstractive summaries for {len(reviews_by_app)} apps as a batch")
+        extractive_summaries, abstractive_summaries = run_sync(self._with_extractive_summaries(
+            reviews_by_app, agent.create_summaries_batch(reviews_by_app)
+        ))
+        
+        self.logger.info("Submitting summary evaluations as a batch")
+        evaluation_reports = run_sync(agent.evaluate_summaries_batch({
+            app_id: (extractive_summaries[app_id], abstractive_summaries[app_id])
+            for app_id in reviews_by_app
+        }))
+        
+        results = self._save_app_results(
+            reviews_by_app, extractive_summaries, abstractive_summaries, evaluation_reports
+        )
+        
+        self.logger.info(f"Batch analysis completed for {len(results)} apps")
+        return results
+    
+    def analyze_apps(
+        self,
+        app_ids: List[str],
+        review_count: int = AppConfig.DEFAULT_REVIEW_COUNT
+    ) -> Dict[str, ComparisonResult]:
+        """
+        Analyze several apps, summarizing as many apps per agent prompt as fit.
+        
+        Unlike analyze_apps_batch this runs in real time; the saving comes from
+        sharing one system prompt and round-trip across the apps of a prompt.
+        
+        Args:
+            app_ids: Google Play Store app IDs
+            review_count: Number of reviews to analyze per app
+            
+        Returns:
+            ComparisonResult objects keyed by app ID
+        """
+        agent = ReviewAnalysisAgent(self.openai_api_key)
+        reviews_by_app = self._scrape_apps(app_ids, review_count)
+        
+        self.logger.info(f"Generating abstractive summaries for {len(reviews_by_app)} apps")
+        extractive_summaries, abstractive_results = run_sync(self._with_extractive_summaries(
+            reviews_by_app, agent.acreate_summaries(list(reviews_by_app.values()))
+        ))
+        abstractive_summaries = dict(zip(reviews_by_app, abstractive_results))
+        
+        async def evaluate_all() -> List[EvaluationReport]:
+            return await asyncio.gather(*(
+                agent.aevaluate_summaries(extractive_summaries[app_id], abstractive_summaries[app_id])
+                for app_id in reviews_by_app
+            ))
+        
+        self.logger.info("Evaluating summaries")
+        evaluation_reports = dict(zip(reviews_by_app, run_sync(evaluate_all())))
+        
+        results = self._save_app_results(
+            reviews_by_app, extractive_summaries, abstractive_summaries, evaluation_reports
+        )
+        
+        self.logger.info(f"Multi-app analysis completed for {len(results)} apps")
+        return results
+    
+    async def _with_extractive_summaries(
+        self,
+        reviews_by_app: Dict[str, List[Review]],
+        abstractive: Awaitable[T]
+    ) -> Tuple[Dict[str, SummaryResult], T]:
+        """
+        Compute the extractive summaries of several apps while the abstractive ones are awaited.
+        
+        LexRank is CPU work, so it runs in a worker thread and is hidden behind the agent's network time.
+        
+        Args:
+            reviews_by_app: Reviews keyed by app ID
+            abstractive: Pending abstractive summaries
+            
+        Returns:
+            Tuple of (extractive summaries keyed by app ID, abstractive result)
+        """
+        extractive_summaries, abstractive_result = await asyncio.gather(
+            asyncio.to_thread(lambda: {
+                app_id: self.extractive_service.summarize(reviews)
+                for app_id, reviews in reviews_by_app.items()
+            }),
+            abstractive
+        )
+        return extractive_summaries, abstractive_result
+    
+    def _scrape_apps(self, app_ids: List[str], review_count: int) -> Dict[str, List[Review]]:
+        """Scrape and save reviews for several apps; apps without reviews are skipped."""
+        reviews_by_app = {}
+        for app_id in app_ids:
+            self.logger.info(f"Scraping reviews for multi-app analysis: {app_id}")
+            reviews_data = ScraperService(app_id).scrape_reviews(count=review_count)
+            if not reviews_data.reviews:
+                self.logger.warning(f"No reviews found for {app_id}, skipping")
+                continue
+            self.data_service.save_reviews_data(
+                reviews_data, os.path.join(AppConfig.RESULTS_DIR, f"{app_id}_reviews.json")
+            )
+            reviews_by_app[app_id] = reviews_data.reviews
+        return reviews_by_app
+    
+    def _save_app_results(
+        self,
+        reviews_by_app: Dict[str, List[Review]],
+        extractive_summaries: Dict[str, SummaryResult],
+        abstractive_summaries: Dict[str, SummaryResult],
+        evaluation_reports: Dict[str, EvaluationReport]
+    ) -> Dict[str, ComparisonResult]:
+        """Build and save the comparison result of each app of a multi-app analysis."""
+        results = {}
+        for app_id in reviews_by_app:
+            comparison_result = self.comparison_service.create_comparison_result(
+                extractive_summaries[app_id], abstractive_summaries[app_id], evaluation_reports[app_id]
+            )
+            self.data_service.save_results_data(
+                comparison_result, os.path.join(AppConfig.RESULTS_DIR, f"{app_id}_results.json")
+            )
+            results[app_id] = comparison_result
+        return results
+    
     def validate_setup(self) -> bool:
         """
         Validate that the service is properly configured.
@@ -156,9 +355,8 @@ class AnalysisService:
             True if setup is valid, False otherwise
         """
         try:
-            # Test OpenAI connection
-            test_reviews = []
-            self.abstractive_service.summarize(test_reviews)
+            # Test the OpenAI connection with a metadata request instead of an agent run
+            run_sync(self.abstractive_service.client.models.retrieve(SummarizationConfig.AGENT_MODEL))
             return True
         except Exception:
             return False
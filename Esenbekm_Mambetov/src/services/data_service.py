@@ -1,24 +1,36 @@
 """Data loading and saving services."""
 
-import json
-import tempfile
-import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import BinaryIO, Dict, Any, Optional
 from pathlib import Path
 
-from ..models.review import ReviewsData
+import ijson
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..models.review import ReviewsData, ReviewsColumnar, ReviewsMetadata, REVIEW_SCHEMA, records_to_batch
 from ..models.summary import ComparisonResult
 from ..config.settings import AppConfig
 
+# Same layout as json.dump(..., ensure_ascii=False, indent=2)
+JSON_SAVE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+# Reviews files with this suffix are stored as Parquet, with the metadata in the schema metadata
+PARQUET_SUFFIX = '.parquet'
+PARQUET_METADATA_KEY = b'reviews_metadata'
 
 class DataService:
     """Service for loading and saving application data."""
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def ensure_results_dir():
-        """Ensure the results directory exists."""
+        """Ensure the results directory exists; checked once per process."""
         results_dir = Path(AppConfig.RESULTS_DIR)
-        results_dir.mkdir(exist_ok=True)
+        results_dir.mkdir(parents=True, exist_ok=True)
     
     @staticmethod
     def load_reviews_data(file_path: str) -> Optional[ReviewsData]:
@@ -32,16 +44,65 @@ class DataService:
             ReviewsData object or None if error
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if Path(file_path).suffix == PARQUET_SUFFIX:
+                return DataService._load_reviews_parquet(file_path)
+            if DataService.get_file_size(file_path) >= AppConfig.STREAMING_JSON_THRESHOLD:
+                return DataService._stream_reviews_data(file_path)
+            data = orjson.loads(Path(file_path).read_bytes())
             return ReviewsData.from_dict(data)
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        except (FileNotFoundError, orjson.JSONDecodeError, ijson.JSONError, KeyError, ValueError, pa.ArrowException):
             return None
     
+    @staticmethod
+    def _load_reviews_parquet(file_path: str) -> ReviewsData:
+        """
+        Load reviews saved as Parquet by save_reviews_data.
+        
+        Args:
+            file_path: Path to the Parquet file
+            
+        Returns:
+            ReviewsData object
+        """
+        table = pq.read_table(file_path)
+        # Files saved before dates were kept as strings store them as date32
+        dates = pc.cast(table.column('date'), pa.string())
+        table = table.set_column(table.schema.get_field_index('date'), 'date', dates)
+        metadata = orjson.loads((table.schema.metadata or {}).get(PARQUET_METADATA_KEY, b'{}'))
+        return ReviewsData(
+            reviews=ReviewsColumnar.from_table(table),
+            metadata=ReviewsMetadata.from_dict(metadata)
+        )
+    
+    @staticmethod
+    def _stream_reviews_data(file_path: str) -> ReviewsData:
+        """
+        Load a large reviews file without materializing the full list of review dicts.
+        
+        Args:
+            file_path: Path to the JSON file
+            
+        Returns:
+            ReviewsData object
+        """
+        batches = []
+        with open(file_path, 'rb') as f:
+            items = ijson.items(f, 'reviews.item', use_float=True)
+            while batch := list(islice(items, AppConfig.BATCH_SIZE)):
+                batches.append(records_to_batch(batch))
+        
+        with open(file_path, 'rb') as f:
+            metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+        
+        return ReviewsData(
+            reviews=ReviewsColumnar.from_table(pa.Table.from_batches(batches, schema=REVIEW_SCHEMA)),
+            metadata=ReviewsMetadata.from_dict(metadata)
+        )
+    
     @staticmethod
     def save_reviews_data(reviews_data: ReviewsData, file_path: str) -> bool:
         """
-        Save reviews data to JSON file.
+        Save reviews data to a JSON file, or to Parquet if the path ends in .parquet.
         
         Args:
             reviews_data: ReviewsData object to save
@@ -54,12 +115,51 @@ class DataService:
             # Ensure results directory exists
             DataService.ensure_results_dir()
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(reviews_data.to_dict(), f, ensure_ascii=False, indent=2)
+            if Path(file_path).suffix == PARQUET_SUFFIX:
+                # Columnar and zstd-compressed: several times smaller than the JSON file
+                table = reviews_data.columns.to_arrow().replace_schema_metadata({
+                    PARQUET_METADATA_KEY: orjson.dumps(reviews_data.metadata, option=orjson.OPT_SERIALIZE_DATACLASS)
+                })
+                pq.write_table(table, file_path, compression='zstd')
+                return True
+            
+            with open(file_path, 'wb') as f:
+                DataService._write_reviews_json(f, reviews_data)
             return True
         except Exception:
             return False
     
+    @staticmethod
+    def _write_reviews_json(f: BinaryIO, reviews_data: ReviewsData) -> None:
+        """
+        Write reviews data as JSON, BATCH_SIZE reviews at a time.
+        
+        Only one batch of encoded reviews is in memory at once, instead of the full
+        list of review dicts plus the encoded document. The output is identical to
+        encoding the whole document with JSON_SAVE_OPTIONS.
+        
+        Args:
+            f: Binary file to write to
+            reviews_data: ReviewsData object to save
+        """
+        reviews = reviews_data.reviews
+        separator = b'\n    '
+        
+        f.write(b'{\n  "reviews": [')
+        for start in range(0, len(reviews), AppConfig.BATCH_SIZE):
+            batch = reviews[start:start + AppConfig.BATCH_SIZE]
+            if isinstance(batch, ReviewsColumnar):
+                batch = batch.to_records()
+            # orjson encodes the dataclasses directly, without an intermediate to_dict() tree;
+            # re-indent each review one level deeper, as it sits inside the document
+            f.write(b','.join(
+                separator + orjson.dumps(review, option=JSON_SAVE_OPTIONS).replace(b'\n', separator)
+                for review in batch
+            ) + (b',' if start + AppConfig.BATCH_SIZE < len(reviews) else b''))
+        f.write(b'\n  ],\n  "metadata": ' if len(reviews) else b'],\n  "metadata": ')
+        f.write(orjson.dumps(reviews_data.metadata, option=JSON_SAVE_OPTIONS).replace(b'\n', b'\n  '))
+        f.write(b'\n}')
+    
     @staticmethod
     def load_results_data(file_path: str) -> Optional[ComparisonResult]:
         """
@@ -72,10 +172,9 @@ class DataService:
             ComparisonResult object or None if error
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(Path(file_path).read_bytes())
             return ComparisonResult.from_dict(data)
-        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        except (FileNotFoundError, orjson.JSONDecodeError, KeyError):
             return None
     
     @staticmethod
@@ -94,8 +193,7 @@ class DataService:
             # Ensure results directory exists
             DataService.ensure_results_dir()
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(results.to_dict(), f, ensure_ascii=False, indent=2)
+            Path(file_path).write_bytes(orjson.dumps(results, option=JSON_SAVE_OPTIONS))
             return True
         except Exception:
             return False
@@ -112,15 +210,8 @@ class DataService:
             Parsed JSON data or None if error
         """
         try:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                f.write(uploaded_file.getvalue().decode())
-                temp_path = f.name
-            
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            os.unlink(temp_path)
-            return data
+            # The upload is already in memory, so parse its bytes directly
+            return orjson.loads(uploaded_file.getvalue())
         except Exception:
             return None
     
@@ -135,4 +226,10 @@ class DataService:
         try:
             return Path(file_path).stat().st_size
         except (FileNotFoundError, OSError):
-            return 0
\ No newline at end of file
+            return 0
+
+
+@lru_cache(maxsize=1)
+def get_data_service() -> DataService:
+    """Return the shared DataService instance."""
+    return DataService()
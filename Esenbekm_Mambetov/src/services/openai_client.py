@@ -0,0 +1,51 @@
+"""Shared OpenAI client for the Agents SDK services."""
+
+import asyncio
+from functools import lru_cache
+from typing import Awaitable, TypeVar
+
+import httpx
+from openai import AsyncOpenAI
+
+from ..config.settings import SummarizationConfig
+
+T = TypeVar('T')
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client, so repeated agent runs reuse warm keep-alive connections."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=SummarizationConfig.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=SummarizationConfig.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=SummarizationConfig.HTTP_KEEPALIVE_EXPIRY
+        ),
+        timeout=httpx.Timeout(
+            SummarizationConfig.AGENT_TIMEOUT,
+            connect=SummarizationConfig.HTTP_CONNECT_TIMEOUT
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str) -> AsyncOpenAI:
+    """Get the OpenAI client for an API key; all clients share one connection pool."""
+    return AsyncOpenAI(api_key=api_key, http_client=_get_http_client())
+
+
+@lru_cache(maxsize=1)
+def get_agent_slots() -> asyncio.Semaphore:
+    """Bound on agent runs in flight, shared by all services so fan-outs stay under the rate limit."""
+    return asyncio.Semaphore(SummarizationConfig.AGENT_CONCURRENCY)
+
+
+@lru_cache(maxsize=1)
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop for synchronous callers; the pooled connections stay bound to it."""
+    return asyncio.new_event_loop()
+
+
+def run_sync(coroutine: Awaitable[T]) -> T:
+    """Run a coroutine to completion from synchronous code."""
+    return _get_event_loop().run_until_complete(coroutine)
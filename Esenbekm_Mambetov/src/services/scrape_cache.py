@@ -0,0 +1,70 @@
+"""Persistent cache for Google Play Store responses."""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+
+def response_key(*parts: Hashable) -> str:
+    """BLAKE2b key of the request parameters (case-sensitive, unlike summary cache keys)."""
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=32).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of pickled scraper responses with a time-to-live.
+    
+    The scraper calls it from worker threads, so the connection is shared
+    across threads behind a lock.
+    """
+    
+    def __init__(self, db_path: str, ttl: float):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            db_path: SQLite database file
+            ttl: Seconds a response stays valid
+        """
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS play_responses ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+        self.ttl = ttl
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, stale: bool = False) -> Optional[Any]:
+        """
+        Return the response stored under a key, unless missing or expired.
+        
+        Args:
+            key: Cache key
+            stale: Return the response even if it has expired
+            
+        Returns:
+            The response, or None
+        """
+        max_age = float('inf') if stale else self.ttl
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT value FROM play_responses WHERE key = ? AND stored_at >= ?",
+                (key, time.time() - max_age)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store a response, replacing any previous one under the key."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO play_responses (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, blob, time.time())
+            )
+            self.connection.commit()
@@ -1,33 +1,53 @@
 """Google Play Store scraping service."""
 
-from typing import Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple, TypeVar
 from datetime import datetime
+from operator import itemgetter
 
 from google_play_scraper import app, reviews, Sort
+from google_play_scraper.exceptions import ExtraHTTPError
 
-from ..models.review import Review, ReviewsData, ReviewsMetadata
+import pyarrow as pa
+import requests
+from tenacity import Retrying, retry_if_exception_type, retry_if_result, stop_after_attempt, wait_exponential
+
+from ..models.review import ReviewsColumnar, ReviewsData, ReviewsMetadata, REVIEW_SCHEMA
 from ..config.settings import AppConfig
 from ..utils.logger import Logger
+from .scrape_cache import ResponseCache, response_key
+
+T = TypeVar('T')
+
+# Errors worth retrying: non-404 HTTP statuses (429, 503, ...) and network failures.
+# NotFoundError is not among them, so a missing app fails at once.
+TRANSIENT_ERRORS = (ExtraHTTPError, OSError)
+
+PLAY_STORE_APP_URL = "https://play.google.com/store/apps/details"
 
 
 class ScraperService:
     """Service for scraping Google Play Store reviews."""
     
-    def __init__(self, app_id: str):
+    def __init__(self, app_id: str, cache_file: Optional[str] = AppConfig.SCRAPE_CACHE_FILE):
         """
         Initialize scraper service.
         
         Args:
             app_id: Google Play Store app ID
+            cache_file: SQLite file caching Play Store responses (None disables the cache)
         """
         self.app_id = app_id
         self.logger = Logger.get_logger()
+        self.cache = ResponseCache(cache_file, AppConfig.SCRAPE_CACHE_TTL) if cache_file else None
     
     def scrape_reviews(
         self, 
         count: Optional[int] = None, 
         lang: str = AppConfig.DEFAULT_LANGUAGE,
-        country: str = AppConfig.DEFAULT_COUNTRY
+        country: str = AppConfig.DEFAULT_COUNTRY,
+        force_refresh: bool = False
     ) -> ReviewsData:
         """
         Scrape reviews from Google Play Store.
@@ -36,6 +56,31 @@ class ScraperService:
             count: Number of reviews to scrape (None for all available)
             lang: Language code
             country: Country code
+            force_refresh: Fetch from the Play Store even if responses are cached
+            
+        Returns:
+            ReviewsData object containing reviews and metadata
+        """
+        return asyncio.run(self._scrape_async(count, lang, country, force_refresh))
+    
+    async def _scrape_async(
+        self,
+        count: Optional[int],
+        lang: str,
+        country: str,
+        force_refresh: bool = False
+    ) -> ReviewsData:
+        """
+        Scrape reviews, fetching the app information concurrently with them.
+        
+        Review pages cannot be fetched concurrently, since each page needs the
+        continuation token of the previous one; the app page is independent.
+        
+        Args:
+            count: Number of reviews to scrape (None for all available)
+            lang: Language code
+            country: Country code
+            force_refresh: Bypass cached Play Store responses
             
         Returns:
             ReviewsData object containing reviews and metadata
@@ -44,105 +89,15 @@ class ScraperService:
             self.logger.info(f"Starting review scraping for app: {self.app_id}")
             self.logger.info(f"Target count: {count}, language: {lang}, country: {country}")
             
-            # Get app info first
-            self.logger.info("Fetching app information...")
-            app_info = app(self.app_id, lang=lang, country=country)
+            # The blocking scraper calls run in worker threads, so both requests are in flight at once
+            self.logger.info("Fetching app information and reviews...")
+            app_info, (review_objects, fetched_count) = await asyncio.gather(
+                asyncio.to_thread(self._fetch_app, lang, country, force_refresh),
+                asyncio.to_thread(self._collect_reviews, count, lang, country, force_refresh)
+            )
             app_title = app_info.get('title', 'Unknown App')
             self.logger.info(f"App found: {app_title}")
-            
-            all_reviews = []
-            continuation_token = None
-            batch_size = AppConfig.BATCH_SIZE
-            
-            # If count is specified and small, use single batch
-            if count and count <= batch_size:
-                self.logger.info(f"Using single batch mode for {count} reviews")
-                result, _ = reviews(
-                    self.app_id,
-                    lang=lang,
-                    country=country,
-                    sort=Sort.NEWEST,
-                    count=count
-                )
-                all_reviews.extend(result)
-                self.logger.info(f"Fetched {len(result)} reviews in single batch")
-            else:
-                # Use pagination for larger counts
-                target_count = count or AppConfig.MAX_REVIEWS_LIMIT
-                self.logger.info(f"Using pagination mode for {target_count} reviews")
-                
-                batch_number = 1
-                while len(all_reviews) < target_count:
-                    remaining = target_count - len(all_reviews)
-                    batch_count = min(batch_size, remaining)
-                    
-                    self.logger.info(f"Fetching batch {batch_number}: {batch_count} reviews (total so far: {len(all_reviews)})")
-                    
-                    result, continuation_token = reviews(
-                        self.app_id,
-                        lang=lang,
-                        country=country,
-                        sort=Sort.NEWEST,
-                        count=batch_count,
-                        continuation_token=continuation_token
-                    )
-                    
-                    if not result:
-                        self.logger.warning(f"No more reviews available after batch {batch_number}")
-                        break
-                    
-                    all_reviews.extend(result)
-                    self.logger.info(f"Batch {batch_number} completed: {len(result)} reviews fetched")
-                    
-                    if not continuation_token:
-                        self.logger.info("No continuation token, reached end of available reviews")
-                        break
-                    
-                    batch_number += 1
-            
-            self.logger.info(f"Scraping completed. Total reviews fetched: {len(all_reviews)}")
-            self.logger.info("Starting review parsing and validation...")
-            
-            # Convert to Review objects with detailed logging
-            review_objects = []
-            processed_count = 0
-            invalid_count = 0
-            
-            for i, review_data in enumerate(all_reviews):
-                try:
-                    # Parse date safely
-                    review_date = review_data.get('at')
-                    formatted_date = review_date.strftime('%Y-%m-%d') if review_date else ''
-                    
-                    # Create review object
-                    review = Review(
-                        id=review_data.get('reviewId', str(i)),
-                        rating=review_data.get('score', 0),
-                        text=review_data.get('content', ''),
-                        author=review_data.get('userName', 'Anonymous'),
-                        date=formatted_date
-                    )
-                    
-                    # Validate review
-                    if review.text.strip() and review.rating > 0:
-                        review_objects.append(review)
-                        processed_count += 1
-                        
-                        # Log progress every 10 reviews
-                        if processed_count % 10 == 0:
-                            self.logger.info(f"Processed {processed_count}/{len(all_reviews)} reviews")
-                    else:
-                        invalid_count += 1
-                        self.logger.warning(f"Skipping invalid review {i}: empty text or invalid rating")
-                        
-                except Exception as e:
-                    invalid_count += 1
-                    self.logger.error(f"Error parsing review {i}: {e}")
-            
-            self.logger.info("Review parsing completed:")
-            self.logger.info(f"  - Valid reviews: {len(review_objects)}")
-            self.logger.info(f"  - Invalid reviews: {invalid_count}")
-            self.logger.info(f"  - Success rate: {len(review_objects)/len(all_reviews)*100:.1f}%")
+            self.logger.info(f"Scraping completed. Total reviews fetched: {fetched_count}")
             
             # Create metadata
             metadata = ReviewsMetadata(
@@ -170,6 +125,272 @@ class ScraperService:
             )
             return ReviewsData(reviews=[], metadata=metadata)
     
+    def _collect_reviews(
+        self,
+        count: Optional[int],
+        lang: str,
+        country: str,
+        force_refresh: bool = False
+    ) -> Tuple[ReviewsColumnar, int]:
+        """
+        Fetch and parse reviews into columns; each page is parsed while the next one downloads.
+        
+        Args:
+            count: Number of reviews to scrape (None for all available)
+            lang: Language code
+            country: Country code
+            force_refresh: Bypass cached Play Store responses
+            
+        Returns:
+            Tuple of (valid reviews, number of reviews fetched)
+        """
+        self.logger.info("Starting review parsing and validation...")
+        
+        batches = []
+        fetched_count = 0
+        seen_ids = set()
+        duplicate_count = 0
+        # google_play_scraper emits every field for each review, so one C-level getter unpacks them all
+        review_fields = itemgetter('reviewId', 'score', 'content', 'userName', 'at')
+        
+        for page in self._fetch_pages(count, lang, country, force_refresh):
+            rows = []
+            for i, review_data in enumerate(page, fetched_count):
+                review_id, score, content, author, at = review_fields(review_data)
+                
+                # Overlapping pages repeat reviews; keep the first copy of each id (reviews without one are kept)
+                if review_id is not None:
+                    if review_id in seen_ids:
+                        duplicate_count += 1
+                        continue
+                    seen_ids.add(review_id)
+                
+                # Reviews without text or rating are dropped
+                if not (content or '').strip() or not (score or 0) > 0:
+                    continue
+                
+                rows.append({
+                    'id': review_id or str(i),
+                    'rating': score,
+                    'text': content,
+                    'author': author or 'Anonymous',
+                    'date': f"{at.year:04d}-{at.month:02d}-{at.day:02d}" if at else ''
+                })
+            
+            # One Arrow batch per page
+            batches.append(pa.RecordBatch.from_pylist(rows, schema=REVIEW_SCHEMA))
+            fetched_count += len(page)
+        
+        # Struct-of-arrays result, so downstream rating and date scans are vectorized
+        review_objects = ReviewsColumnar.from_table(pa.Table.from_batches(batches, schema=REVIEW_SCHEMA))
+        invalid_count = fetched_count - duplicate_count - len(review_objects)
+        
+        self.logger.info("Review parsing completed:")
+        self.logger.info(f"  - Valid reviews: {len(review_objects)}")
+        self.logger.info(f"  - Invalid reviews: {invalid_count}")
+        self.logger.info(f"  - Duplicate reviews: {duplicate_count}")
+        if fetched_count:
+            self.logger.info(f"  - Success rate: {len(review_objects) * 100 / fetched_count:.1f}%")
+        
+        return review_objects, fetched_count
+    
+    def _fetch_pages(
+        self,
+        count: Optional[int],
+        lang: str,
+        country: str,
+        force_refresh: bool = False
+    ) -> Iterator[List[dict]]:
+        """
+        Fetch raw review dicts page by page, newest first, following continuation tokens.
+        
+        The request for the next page is submitted to a worker thread before the
+        current page is yielded, so it is on the wire while the caller parses.
+        
+        Args:
+            count: Number of reviews to fetch (None for up to MAX_REVIEWS_LIMIT)
+            lang: Language code
+            country: Country code
+            force_refresh: Bypass cached Play Store responses
+            
+        Yields:
+            Pages of review dicts as returned by google_play_scraper
+        """
+        # Pages as large as the Play Store serves, so a scrape takes as few sequential round-trips as possible
+        page_size = AppConfig.SCRAPE_PAGE_SIZE
+        
+        # If count is specified and small, use single batch
+        if count and count <= page_size:
+            self.logger.info(f"Using single batch mode for {count} reviews")
+            result, _ = self._fetch_batch(None, count, lang, country, force_refresh)
+            self.logger.info(f"Fetched {len(result)} reviews in single batch")
+            yield result
+            return
+        
+        # Use pagination for larger counts
+        target_count = count or AppConfig.MAX_REVIEWS_LIMIT
+        self.logger.info(f"Using pagination mode for {target_count} reviews")
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetched_count = 0
+            batch_number = 1
+            batch_count = min(page_size, target_count)
+            self.logger.info(f"Fetching batch {batch_number}: {batch_count} reviews (total so far: 0)")
+            future = executor.submit(self._fetch_batch, None, batch_count, lang, country, force_refresh)
+            
+            while future is not None:
+                result, continuation_token = future.result()
+                future = None
+                
+                if not result:
+                    self.logger.warning(f"No more reviews available after batch {batch_number}")
+                    break
+                
+                fetched_count += len(result)
+                self.logger.info(f"Batch {batch_number} completed: {len(result)} reviews fetched")
+                
+                if not continuation_token or continuation_token.token is None:
+                    self.logger.info("No continuation token, reached end of available reviews")
+                elif fetched_count < target_count:
+                    batch_number += 1
+                    batch_count = min(page_size, target_count - fetched_count)
+                    self.logger.info(f"Fetching batch {batch_number}: {batch_count} reviews (total so far: {fetched_count})")
+                    future = executor.submit(
+                        self._fetch_batch, continuation_token, batch_count, lang, country, force_refresh
+                    )
+                
+                yield result
+    
+    def _fetch_batch(
+        self,
+        continuation_token,
+        count: int,
+        lang: str,
+        country: str,
+        force_refresh: bool = False
+    ) -> Tuple[List[dict], Any]:
+        """
+        Fetch one page of reviews.
+        
+        Args:
+            continuation_token: Token from the previous page, or None for the first page
+            count: Number of reviews to request
+            lang: Language code
+            country: Country code
+            force_refresh: Bypass a cached response
+            
+        Returns:
+            Tuple of (review dicts, continuation token for the next page)
+        """
+        token = continuation_token.token if continuation_token else None
+        return self._cached(
+            ('reviews', lang, country, token, count),
+            lambda: self._with_retry(
+                lambda: reviews(
+                    self.app_id,
+                    lang=lang,
+                    country=country,
+                    sort=Sort.NEWEST,
+                    count=count,
+                    continuation_token=continuation_token
+                ),
+                # google_play_scraper returns an empty page instead of raising on errors; after
+                # a continuation token more reviews are known to exist, so an empty page is a failure
+                retry_result=lambda response: not response[0] and token is not None
+            ),
+            force_refresh,
+            cacheable=lambda response: bool(response[0])
+        )
+    
+    def _fetch_app(
+        self,
+        lang: Optional[str] = None,
+        country: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> dict:
+        """
+        Fetch the app details; a language or country left as None takes the scraper default.
+        
+        Listings change rarely, so if the Play Store cannot be reached an expired
+        cached listing is returned instead of failing.
+        """
+        kwargs = {name: value for name, value in (('lang', lang), ('country', country)) if value is not None}
+        return self._cached(
+            ('app', lang, country),
+            lambda: self._with_retry(lambda: app(self.app_id, **kwargs)),
+            force_refresh,
+            stale_if_error=True
+        )
+    
+    def _with_retry(
+        self,
+        fetch: Callable[[], T],
+        retry_result: Callable[[T], bool] = lambda response: False
+    ) -> T:
+        """
+        Make a Play Store request, retrying transient failures with exponential backoff.
+        
+        Args:
+            fetch: Performs the request
+            retry_result: Whether a response that did not raise still counts as failed
+            
+        Returns:
+            The response; once attempts run out, the last response, or its error is raised
+        """
+        retrying = Retrying(
+            stop=stop_after_attempt(AppConfig.SCRAPE_RETRY_ATTEMPTS),
+            wait=wait_exponential(multiplier=AppConfig.SCRAPE_RETRY_WAIT, max=AppConfig.SCRAPE_RETRY_MAX_WAIT),
+            retry=retry_if_exception_type(TRANSIENT_ERRORS) | retry_if_result(retry_result),
+            before_sleep=lambda state: self.logger.warning(
+                f"Play Store request failed (attempt {state.attempt_number}), retrying..."
+            ),
+            retry_error_callback=lambda state: state.outcome.result()
+        )
+        return retrying(fetch)
+    
+    def _cached(
+        self,
+        key_parts: Tuple[Hashable, ...],
+        fetch: Callable[[], T],
+        force_refresh: bool = False,
+        cacheable: Callable[[T], bool] = lambda response: True,
+        stale_if_error: bool = False
+    ) -> T:
+        """
+        Return a cached Play Store response, or fetch and cache it.
+        
+        Args:
+            key_parts: Request parameters besides the app ID
+            fetch: Performs the request
+            force_refresh: Skip the cache lookup (the fresh response is still stored)
+            cacheable: Whether a response is worth storing
+            stale_if_error: Fall back to an expired response if the request fails transiently
+            
+        Returns:
+            The response
+        """
+        if self.cache is None:
+            return fetch()
+        
+        key = response_key(self.app_id, *key_parts)
+        if not force_refresh:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+        
+        try:
+            response = fetch()
+        except TRANSIENT_ERRORS as e:
+            response = self.cache.get(key, stale=True) if stale_if_error else None
+            if response is None:
+                raise
+            self.logger.warning(f"Play Store request failed ({e}), using expired cached response")
+            return response
+        
+        if cacheable(response):
+            self.cache.put(key, response)
+        return response
+    
     def get_app_info(self, lang: str = AppConfig.DEFAULT_LANGUAGE) -> dict:
         """
         Get app information from Google Play Store.
@@ -181,7 +402,7 @@ class ScraperService:
             App information dictionary
         """
         try:
-            return app(self.app_id, lang=lang)
+            return self._fetch_app(lang)
         except Exception:
             return {}
     
@@ -193,7 +414,21 @@ class ScraperService:
             True if app exists, False otherwise
         """
         try:
-            app(self.app_id)
-            return True
+            # A HEAD request only needs the status line, not the full listing page app() parses
+            status = self._cached(
+                ('exists',),
+                lambda: self._with_retry(
+                    lambda: requests.head(
+                        PLAY_STORE_APP_URL,
+                        params={'id': self.app_id},
+                        timeout=AppConfig.APP_CHECK_TIMEOUT,
+                        allow_redirects=False
+                    ).status_code,
+                    retry_result=lambda status: status == 429 or status >= 500
+                ),
+                # Only a definite answer is remembered, not a rate limit or server error
+                cacheable=lambda status: status in (200, 404)
+            )
+            return status == 200
         except Exception:
             return False
\ No newline at end of file
@@ -3,30 +3,146 @@
 import time
 import json
 import re
-from typing import List
-import nltk
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import orjson
 from sumy.parsers.plaintext import PlaintextParser
-from sumy.nlp.tokenizers import Tokenizer
 from sumy.summarizers.lex_rank import LexRankSummarizer
 from sumy.nlp.stemmers import Stemmer
-from openai import OpenAI
-from agents import Agent, Runner, function_tool, ModelSettings
+from agents import Agent, Runner, RunConfig, function_tool, ModelSettings, set_default_openai_client
 
-from ..models.review import Review
+from ..models.review import Review, ReviewsColumnar
 from ..models.summary import SummaryResult, ComparisonMetrics, EvaluationReport, ComparisonResult
 from ..config.settings import SummarizationConfig
 from ..utils.logger import Logger
+from ..utils.text_stats import count_sentences
+from .openai_client import get_agent_slots, get_openai_client, run_sync
+
+# Terms the fallback summary looks for in low- and high-rated reviews, as one alternation each
+COMPLAINT_TERMS_RE = re.compile('|'.join(map(re.escape, [
+    'не работает', 'сбой', 'ошибка', 'проблема', 'лагает', 'глючит', 'медленно', 'висит'
+])))
+POSITIVE_TERMS_RE = re.compile('|'.join(map(re.escape, [
+    'удобн', 'хорош', 'отличн', 'быстр', 'прост', 'легк', 'нравится', 'классн'
+])))
+
+# Apologies and meta-commentary that agent responses sometimes open with
+APOLOGETIC_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"К сожалению, у меня возникли проблемы.*?Однако,?\s*",
+        r"Извините.*?проблем.*?Тем не менее,?\s*",
+        r"У меня возникли сложности.*?Но\s*",
+        r".*?проблемы с использованием инструмента.*?Однако,?\s*",
+        r".*?не удалось использовать инструмент.*?Тем не менее,?\s*",
+    )
+]
+TOOL_PROBLEM_PHRASES = (
+    "на основе моего анализа отзывов, я могу сделать следующие выводы:",
+    "основываясь на анализе отзывов:",
+    "исходя из содержания отзывов:",
+    "на основе представленных отзывов:",
+)
+BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+JSON_DECODER = json.JSONDecoder()
 
-# Ensure NLTK data is downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+class RegexTokenizer:
+    """
+    Sentence and word tokenizer for sumy built on precompiled regular expressions.
+    
+    Implements the two methods sumy's parsers call on a tokenizer. Unlike sumy's
+    Tokenizer it needs neither the NLTK punkt model nor nltk.word_tokenize.
+    """
+    
+    # Split after terminal punctuation followed by whitespace
+    SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?…])\s+')
+    # Letters only, optionally joined by hyphens or apostrophes, as sumy keeps from word_tokenize
+    WORD_RE = re.compile(r"[^\W\d_]+(?:['-][^\W\d_]+)*")
+    
+    def __init__(self, language: str):
+        """
+        Initialize tokenizer.
+        
+        Args:
+            language: Language of the text (for sumy's Tokenizer interface)
+        """
+        self.language = language
+    
+    def to_sentences(self, paragraph: str) -> Tuple[str, ...]:
+        """Split a paragraph into stripped, non-empty sentences."""
+        return tuple(sentence for sentence in map(str.strip, self.SENTENCE_SPLIT_RE.split(paragraph)) if sentence)
+    
+    def to_words(self, sentence: str) -> Tuple[str, ...]:
+        """Split a sentence into words, dropping punctuation and numbers."""
+        return tuple(self.WORD_RE.findall(sentence))
+
+
+class VectorizedLexRankSummarizer(LexRankSummarizer):
+    """
+    LexRank with the sentence similarity matrix computed by NumPy.
+    
+    sumy builds the TF-IDF cosine matrix with a Python loop over every sentence
+    pair; here the sentence term weights form one matrix, and the cosine matrix
+    is a single matrix product. The scores, and so the chosen sentences, are the
+    same as sumy's: same tf, idf, threshold and power method.
+    """
+    
+    def __call__(self, document, sentences_count):
+        sentences = document.sentences
+        sentences_words = [self._to_words_set(sentence) for sentence in sentences]
+        if not sentences_words:
+            return tuple()
+        
+        # Term counts per sentence (rows) and term (columns)
+        vocabulary = {}
+        rows = []
+        columns = []
+        for row, words in enumerate(sentences_words):
+            for word in words:
+                rows.append(row)
+                columns.append(vocabulary.setdefault(word, len(vocabulary)))
+        counts = np.zeros((len(sentences_words), max(len(vocabulary), 1)))
+        np.add.at(counts, (rows, columns), 1)
+        
+        # tf relative to each sentence's most frequent term; idf over sentences as documents
+        max_tf = counts.max(axis=1, keepdims=True)
+        max_tf[max_tf == 0] = 1
+        idf = np.log(len(sentences_words) / (1 + np.count_nonzero(counts, axis=0)))
+        weights = counts / max_tf * idf
+        
+        # idf-modified cosine; sentences with a zero-length vector are similar to nothing
+        norms = np.sqrt(np.einsum('ij,ij->i', weights, weights))
+        similarity = weights @ weights.T
+        nonzero = norms > 0
+        similarity[nonzero] /= norms[nonzero, None]
+        similarity[:, nonzero] /= norms[nonzero]
+        similarity[~nonzero] = 0
+        similarity[:, ~nonzero] = 0
+        
+        # Thresholded adjacency, each row divided by its degree
+        matrix = (similarity > self.threshold).astype(float)
+        degrees = matrix.sum(axis=1)
+        degrees[degrees == 0] = 1
+        matrix /= degrees[:, None]
+        
+        scores = self.power_method(matrix, self.epsilon)
+        return self._get_best_sentences(sentences, sentences_count, dict(zip(sentences, scores)))
+
+
+@lru_cache(maxsize=8)
+def _get_tokenizer(language: str) -> RegexTokenizer:
+    """Tokenizer for a language, built once."""
+    return RegexTokenizer(language)
+
+
+@lru_cache(maxsize=8)
+def _get_summarizer(language: str) -> LexRankSummarizer:
+    """LexRank summarizer with the stemmer for a language, built once."""
+    return VectorizedLexRankSummarizer(Stemmer(language))
 
 
 class ExtractiveService:
@@ -40,8 +156,7 @@ class ExtractiveService:
             language: Language for stemmer
         """
         self.language = language
-        self.stemmer = Stemmer(language)
-        self.summarizer = LexRankSummarizer(self.stemmer)
+        self.summarizer = _get_summarizer(language)
     
     def summarize(self, reviews: List[Review], sentence_count: int = SummarizationConfig.EXTRACTIVE_SENTENCE_COUNT) -> SummaryResult:
         """
@@ -56,8 +171,9 @@ class ExtractiveService:
         """
         start_time = time.time()
         
-        # Combine all review texts
-        combined_text = ' '.join([review.text for review in reviews if review.text.strip()])
+        # Combine all review texts; columnar reviews hand over their text column without building Review objects
+        texts = reviews.texts if isinstance(reviews, ReviewsColumnar) else (review.text for review in reviews)
+        combined_text = ' '.join(text for text in texts if text and not text.isspace())
         
         if not combined_text.strip():
             return SummaryResult(
@@ -70,7 +186,7 @@ class ExtractiveService:
         
         try:
             # Parse text
-            parser = PlaintextParser.from_string(combined_text, Tokenizer("russian"))
+            parser = PlaintextParser.from_string(combined_text, _get_tokenizer(self.language))
             
             # Generate summary
             summary_sentences = self.summarizer(parser.document, sentence_count)
@@ -131,8 +247,8 @@ def compare_summaries(extractive_summary: str, abstractive_summary: str) -> str:
     # Calculate basic metrics
     ext_words = len(extractive_summary.split())
     abs_words = len(abstractive_summary.split())
-    ext_sentences = len([s for s in extractive_summary.split('.') if s.strip()])
-    abs_sentences = len([s for s in abstractive_summary.split('.') if s.strip()])
+    ext_sentences = count_sentences(extractive_summary)
+    abs_sentences = count_sentences(abstractive_summary)
     
     # Calculate word overlap
     ext_words_set = set(extractive_summary.lower().split())
@@ -166,6 +282,46 @@ def compare_summaries(extractive_summary: str, abstractive_summary: str) -> str:
     return comparison_result.strip()
 
 
+SUMMARIZATION_INSTRUCTIONS = """You are an expert mobile app review analyst. Your task is to create clear, structured summaries of user reviews for mobile banking applications.
+
+IMPORTANT RULES:
+- Always respond DIRECTLY with the summary content in Russian
+- NEVER include apologetic messages, tool error mentions, or meta-commentary
+- Do NOT mention tool problems or analysis difficulties
+- Focus only on the content of the reviews
+- Be concise and professional
+
+Your summary should include:
+1. Основные жалобы пользователей (main user complaints)
+2. Положительные аспекты приложения (positive aspects)  
+3. Наиболее часто упоминаемые проблемы (most frequent issues)
+4. Общее впечатление пользователей (overall user impression)
+
+Provide actionable insights for app developers in 3-4 clear sentences."""
+
+
+@lru_cache(maxsize=4)
+def _get_summarization_agent(model: str, temperature: float, max_tokens: int) -> Agent:
+    """
+    Build the summarization agent once per model settings.
+    
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        max_tokens: Answer token limit
+        
+    Returns:
+        Agent shared by all AbstractiveService instances
+    """
+    return Agent(
+        name="ReviewSummarizationAgent",
+        instructions=SUMMARIZATION_INSTRUCTIONS,
+        tools=[summarize_reviews, compare_summaries],
+        model=model,
+        model_settings=ModelSettings(temperature=temperature, max_tokens=max_tokens)
+    )
+
+
 class AbstractiveService:
     """Service for abstractive text summarization using OpenAI Agents SDK."""
     
@@ -185,36 +341,15 @@ class AbstractiveService:
             return
             
         try:
-            self.client = OpenAI(api_key=api_key)
+            # The Agents SDK runs on its default client, so point it at the shared pooled one
+            self.client = get_openai_client(api_key)
+            set_default_openai_client(self.client)
             
-            # Create tools for the agent
-            self.tools = [summarize_reviews, compare_summaries]
-            
-            # Create the summarization agent
-            self.agent = Agent(
-                name="ReviewSummarizationAgent",
-                instructions="""You are an expert mobile app review analyst. Your task is to create clear, structured summaries of user reviews for mobile banking applications.
-
-IMPORTANT RULES:
-- Always respond DIRECTLY with the summary content in Russian
-- NEVER include apologetic messages, tool error mentions, or meta-commentary
-- Do NOT mention tool problems or analysis difficulties
-- Focus only on the content of the reviews
-- Be concise and professional
-
-Your summary should include:
-1. Основные жалобы пользователей (main user complaints)
-2. Положительные аспекты приложения (positive aspects)  
-3. Наиболее часто упоминаемые проблемы (most frequent issues)
-4. Общее впечатление пользователей (overall user impression)
-
-Provide actionable insights for app developers in 3-4 clear sentences.""",
-                tools=self.tools,
-                model=SummarizationConfig.GPT_MODEL,
-                model_settings=ModelSettings(
-                    temperature=SummarizationConfig.GPT_TEMPERATURE,
-                    max_tokens=SummarizationConfig.GPT_MAX_TOKENS
-                )
+            # The agent holds no client state, so every service shares one per model settings
+            self.agent = _get_summarization_agent(
+                SummarizationConfig.GPT_MODEL,
+                SummarizationConfig.GPT_TEMPERATURE,
+                SummarizationConfig.GPT_MAX_TOKENS
             )
             self.agent_available = True
             self.logger.info("OpenAI Agents SDK initialized successfully")
@@ -224,6 +359,10 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
             self.agent_available = False
     
     def summarize(self, reviews: List[Review]) -> SummaryResult:
+        """Generate abstractive summary from reviews, blocking until it is ready."""
+        return run_sync(self.asummarize(reviews))
+    
+    async def asummarize(self, reviews: List[Review]) -> SummaryResult:
         """
         Generate abstractive summary from reviews using the Agent.
         
@@ -252,7 +391,7 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
                 # Use fallback summarization when agent is not available
                 summary_text = self._create_fallback_summary(reviews)
                 word_count = len(summary_text.split())
-                sentence_count = len([s for s in summary_text.split('.') if s.strip()])
+                sentence_count = count_sentences(summary_text)
                 self.logger.info(f"Fallback summary created: {word_count} words, {sentence_count} sentences")
             else:
                 self.logger.info("Using OpenAI Agents SDK for abstractive summarization")
@@ -273,7 +412,8 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
                 """
                 
                 # Execute the agent with the analysis prompt
-                response = Runner.run_sync(self.agent, analysis_prompt)
+                async with get_agent_slots():
+                    response = await Runner.run(self.agent, analysis_prompt)
                 
                 summary_text = response.final_output if hasattr(response, 'final_output') else str(response)
                 
@@ -283,7 +423,7 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
                 
                 # Calculate metrics
                 word_count = len(summary_text.split())
-                sentence_count = len([s for s in summary_text.split('.') if s.strip()])
+                sentence_count = count_sentences(summary_text)
                 
                 self.logger.info(f"Agent-generated summary: {word_count} words, {sentence_count} sentences")
             
@@ -291,7 +431,7 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
             self.logger.error(f"Error in abstractive summarization: {e}")
             summary_text = self._create_fallback_summary(reviews)
             word_count = len(summary_text.split())
-            sentence_count = len([s for s in summary_text.split('.') if s.strip()])
+            sentence_count = count_sentences(summary_text)
         
         processing_time = time.time() - start_time
         
@@ -313,12 +453,11 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
         Returns:
             Formatted reviews text
         """
-        reviews_text = ""
-        for i, review in enumerate(reviews[:50], 1):  # Limit to first 50 reviews
-            if review.text.strip():
-                reviews_text += f"Отзыв {i} (Рейтинг: {review.rating}/5): {review.text}\n\n"
-        
-        return reviews_text
+        return "".join(
+            f"Отзыв {i} (Рейтинг: {review.rating}/5): {review.text}\n\n"
+            for i, review in enumerate(reviews[:50], 1)  # Limit to first 50 reviews
+            if review.text and not review.text.isspace()
+        )
     
     def _create_fallback_summary(self, reviews: List[Review]) -> str:
         """
@@ -333,41 +472,33 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
         if not reviews:
             return "Отзывы для анализа отсутствуют."
         
-        # Count ratings distribution
-        rating_counts = {}
+        # Tally ratings and scan low- and high-rated texts for key terms in one pass;
+        # a text is only lowercased and searched until the first match is found
+        rating_sum = low_ratings = high_ratings = 0
+        has_complaints = has_praise = False
         for review in reviews:
             rating = review.rating
-            rating_counts[rating] = rating_counts.get(rating, 0) + 1
-        
-        # Find most common words in complaints (low ratings)
-        negative_reviews = [r.text.lower() for r in reviews if r.rating <= 2]
-        positive_reviews = [r.text.lower() for r in reviews if r.rating >= 4]
+            rating_sum += rating
+            if rating <= 2:
+                low_ratings += 1
+                has_complaints = has_complaints or COMPLAINT_TERMS_RE.search(review.text.lower()) is not None
+            elif rating >= 4:
+                high_ratings += 1
+                has_praise = has_praise or POSITIVE_TERMS_RE.search(review.text.lower()) is not None
         
-        # Common complaint terms
-        complaint_terms = ['не работает', 'сбой', 'ошибка', 'проблема', 'лагает', 'глючит', 'медленно', 'висит']
-        positive_terms = ['удобн', 'хорош', 'отличн', 'быстр', 'прост', 'легк', 'нравится', 'классн']
-        
-        complaint_mentions = sum(1 for text in negative_reviews for term in complaint_terms if term in text)
-        positive_mentions = sum(1 for text in positive_reviews for term in positive_terms if term in text)
-        
-        # Calculate average rating
-        avg_rating = sum(r.rating for r in reviews) / len(reviews) if reviews else 0
-        
-        # Generate basic summary
         total_reviews = len(reviews)
-        high_ratings = sum(1 for r in reviews if r.rating >= 4)
-        low_ratings = sum(1 for r in reviews if r.rating <= 2)
+        avg_rating = rating_sum / total_reviews
         
         summary_parts = []
         
         if low_ratings > high_ratings:
             summary_parts.append(f"Анализ {total_reviews} отзывов показывает преобладание негативных оценок (средний рейтинг: {avg_rating:.1f}/5).")
-            if complaint_mentions > 0:
+            if has_complaints:
                 summary_parts.append("Основные жалобы связаны с техническими сбоями, ошибками в работе приложения и проблемами с подключением.")
         else:
             summary_parts.append(f"Анализ {total_reviews} отзывов показывает в целом положительное восприятие приложения (средний рейтинг: {avg_rating:.1f}/5).")
             
-        if positive_mentions > 0:
+        if has_praise:
             summary_parts.append("Пользователи отмечают удобство интерфейса, быстроту операций и простоту использования.")
         
         if low_ratings > 0:
@@ -376,6 +507,10 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
         return " ".join(summary_parts) if summary_parts else "Недостаточно данных для создания резюме."
     
     def evaluate_summaries(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> EvaluationReport:
+        """Evaluate and compare two summaries, blocking until the evaluation is ready."""
+        return run_sync(self.aevaluate_summaries(extractive_summary, abstractive_summary))
+    
+    async def aevaluate_summaries(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> EvaluationReport:
         """
         Evaluate and compare two summaries using the Agent.
         
@@ -423,7 +558,8 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
             """
             
             # Execute the agent with the evaluation prompt
-            response = Runner.run_sync(self.agent, evaluation_prompt)
+            async with get_agent_slots():
+                response = await Runner.run(self.agent, evaluation_prompt)
             
             evaluation_text = response.final_output if hasattr(response, 'final_output') else str(response)
             evaluation_text = evaluation_text.strip()
@@ -432,15 +568,8 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
             self.logger.debug(f"Raw evaluation response: {evaluation_text}")
             
             try:
-                # Try to find and parse JSON
-                if '{' in evaluation_text and '}' in evaluation_text:
-                    start = evaluation_text.find('{')
-                    end = evaluation_text.rfind('}') + 1
-                    json_text = evaluation_text[start:end]
-                    evaluation_data = json.loads(json_text)
-                    self.logger.info("Successfully parsed JSON evaluation")
-                else:
-                    raise json.JSONDecodeError("No JSON found", evaluation_text, 0)
+                evaluation_data = self._parse_json_response(evaluation_text)
+                self.logger.info("Successfully parsed JSON evaluation")
                     
             except json.JSONDecodeError as e:
                 self.logger.warning(f"Failed to parse agent evaluation as JSON: {e}")
@@ -482,6 +611,141 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
                 "reasoning": "Ошибка при выполнении оценки агентом"
             })
     
+    def summarize_and_evaluate(
+        self,
+        reviews: List[Review],
+        extractive_summary: SummaryResult
+    ) -> Tuple[SummaryResult, EvaluationReport]:
+        """Generate the abstractive summary and its evaluation, blocking until both are ready."""
+        return run_sync(self.asummarize_and_evaluate(reviews, extractive_summary))
+    
+    async def asummarize_and_evaluate(
+        self,
+        reviews: List[Review],
+        extractive_summary: SummaryResult
+    ) -> Tuple[SummaryResult, EvaluationReport]:
+        """
+        Generate the abstractive summary and evaluate it against the extractive one in a single agent call.
+        
+        Saves the second round trip of asummarize followed by aevaluate_summaries;
+        if the combined response cannot be used, falls back to those two calls.
+        
+        Args:
+            reviews: List of Review objects
+            extractive_summary: Extractive summary of the same reviews
+            
+        Returns:
+            Tuple of (abstractive summary, evaluation report)
+        """
+        reviews_text = self._prepare_reviews_text(reviews)
+        if not self.agent_available or not reviews_text.strip():
+            abstractive_summary = await self.asummarize(reviews)
+            return abstractive_summary, await self.aevaluate_summaries(extractive_summary, abstractive_summary)
+        
+        start_time = time.time()
+        try:
+            self.logger.info("Using OpenAI Agents SDK for combined summarization and evaluation")
+            response_data = await self._summarize_and_evaluate(reviews_text, extractive_summary.text)
+            summary_text = self._clean_agent_response(str(response_data.get('summary', '')).strip())
+            if not summary_text or 'analysis' not in response_data:
+                raise ValueError("response lacks the summary or the analysis")
+        except Exception as e:
+            self.logger.warning(f"Combined summarization failed ({e}), using separate calls")
+            abstractive_summary = await self.asummarize(reviews)
+            return abstractive_summary, await self.aevaluate_summaries(extractive_summary, abstractive_summary)
+        
+        abstractive_summary = SummaryResult(
+            summary_type="abstractive",
+            text=summary_text,
+            word_count=len(summary_text.split()),
+            sentence_count=count_sentences(summary_text),
+            processing_time=time.time() - start_time
+        )
+        self.logger.info(f"Agent-generated summary and evaluation: {abstractive_summary.word_count} words")
+        return abstractive_summary, EvaluationReport.from_dict(response_data)
+    
+    async def _summarize_and_evaluate(self, reviews_text: str, extractive_text: str) -> Dict[str, Any]:
+        """
+        Ask the agent for a summary of the reviews and an evaluation of it next to the extractive baseline.
+        
+        Args:
+            reviews_text: Prepared reviews text
+            extractive_text: Extractive summary text
+            
+        Returns:
+            Parsed response with "summary" and "analysis" keys
+        """
+        prompt = f"""
+        Создайте краткое резюме отзывов о мобильном банковском приложении MBank и сравните его с извлекающим резюме.
+
+        Отзывы:
+        {reviews_text}
+
+        Извлекающее резюме: {extractive_text}
+
+        Структура вашего резюме (3-4 предложения на русском языке):
+        1. Основные жалобы пользователей
+        2. Положительные аспекты приложения
+        3. Наиболее часто упоминаемые проблемы
+        4. Рекомендации для разработчиков
+
+        Затем оцените извлекающее резюме и ваше (абстрактивное) резюме по критериям от 1 до 10 и ответьте ТОЛЬКО в JSON формате:
+        {{
+            "summary": "Текст вашего резюме",
+            "analysis": {{
+                "extractive_coverage": "8",
+                "abstractive_coverage": "9",
+                "extractive_clarity": "7",
+                "abstractive_clarity": "9",
+                "extractive_usefulness": "8",
+                "abstractive_usefulness": "9",
+                "extractive_key_details": "8",
+                "abstractive_key_details": "7",
+                "preferred_summary": "abstractive",
+                "reasoning": "Абстрактивное резюме более структурированное и ясное"
+            }}
+        }}
+
+        ВАЖНО: Отвечайте ТОЛЬКО JSON, без дополнительного текста!
+        """
+        
+        # The response carries both the summary and the scores, so it gets room for both
+        async with get_agent_slots():
+            response = await Runner.run(
+                self.agent,
+                prompt,
+                run_config=RunConfig(model_settings=ModelSettings(
+                    max_tokens=SummarizationConfig.GPT_MAX_TOKENS + SummarizationConfig.GPT_EVALUATION_MAX_TOKENS
+                ))
+            )
+        response_text = response.final_output if hasattr(response, 'final_output') else str(response)
+        return self._parse_json_response(response_text.strip())
+    
+    @staticmethod
+    def _parse_json_response(text: str) -> Dict[str, Any]:
+        """
+        Parse the JSON object in an agent response, ignoring any text around it.
+        
+        Args:
+            text: Agent response text
+            
+        Returns:
+            Parsed JSON object
+            
+        Raises:
+            json.JSONDecodeError: If the response contains no valid JSON object
+        """
+        start = text.find('{')
+        if start == -1:
+            raise json.JSONDecodeError("No JSON found", text, 0)
+        try:
+            # Usually the reply ends with the object, as the prompts ask
+            return orjson.loads(text[start:])
+        except orjson.JSONDecodeError:
+            # Otherwise decode from the first brace and stop where the object ends
+            data, _ = JSON_DECODER.raw_decode(text, start)
+            return data
+    
     def _create_fallback_evaluation(self, extractive_summary: SummaryResult, abstractive_summary: SummaryResult) -> EvaluationReport:
         """
         Create a basic evaluation when agent is not available.
@@ -548,31 +812,16 @@ Provide actionable insights for app developers in 3-4 clear sentences.""",
             return text
             
         # Remove common apologetic patterns
-        apologetic_patterns = [
-            r"К сожалению, у меня возникли проблемы.*?Однако,?\s*",
-            r"Извините.*?проблем.*?Тем не менее,?\s*",
-            r"У меня возникли сложности.*?Но\s*",
-            r".*?проблемы с использованием инструмента.*?Однако,?\s*",
-            r".*?не удалось использовать инструмент.*?Тем не менее,?\s*",
-        ]
-        
         cleaned_text = text
-        for pattern in apologetic_patterns:
-            cleaned_text = re.sub(pattern, "", cleaned_text, flags=re.IGNORECASE | re.DOTALL)
+        for pattern in APOLOGETIC_PATTERNS:
+            cleaned_text = pattern.sub("", cleaned_text)
         
         # Remove phrases about tool problems
-        tool_problem_phrases = [
-            "на основе моего анализа отзывов, я могу сделать следующие выводы:",
-            "основываясь на анализе отзывов:",
-            "исходя из содержания отзывов:",
-            "на основе представленных отзывов:",
-        ]
-        
-        for phrase in tool_problem_phrases:
+        for phrase in TOOL_PROBLEM_PHRASES:
             cleaned_text = cleaned_text.replace(phrase, "")
         
         # Clean up extra whitespace and newlines
-        cleaned_text = re.sub(r'\n\s*\n', '\n\n', cleaned_text.strip())
+        cleaned_text = BLANK_LINES_RE.sub('\n\n', cleaned_text.strip())
         
         return cleaned_text
 
@@ -595,16 +844,15 @@ class ComparisonService:
         if not summary1.text or not summary2.text:
             return 0.0
         
-        words1 = set(ComparisonService._clean_text(summary1.text).lower().split())
-        words2 = set(ComparisonService._clean_text(summary2.text).lower().split())
+        words1 = ComparisonService._word_set(summary1.text)
+        words2 = ComparisonService._word_set(summary2.text)
         
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union) if union else 0.0
+        # Jaccard index; the union size follows from the intersection, so no union set is built
+        overlap = len(words1 & words2)
+        return overlap / (len(words1) + len(words2) - overlap)
     
     @staticmethod
     def calculate_length_ratio(summary1: SummaryResult, summary2: SummaryResult) -> float:
@@ -652,6 +900,12 @@ class ComparisonService:
         """Clean text for comparison."""
         return re.sub(r'[^\w\s]', '', text)
     
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _word_set(text: str) -> frozenset:
+        """Lowercased words of a text without punctuation; cached, as a summary is compared repeatedly."""
+        return frozenset(ComparisonService._clean_text(text).lower().split())
+    
     @staticmethod
     def create_comparison_result(
         extractive_summary: SummaryResult,
@@ -0,0 +1,126 @@
+"""Semantic cache for agent responses."""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from typing import List, Optional
+
+import numpy as np
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: lowercase with collapsed whitespace."""
+    return WHITESPACE_PATTERN.sub(' ', text).strip().lower()
+
+
+def cache_key(*parts: str) -> str:
+    """SHA-256 key of the normalized text parts."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(normalize_text(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class SemanticCache:
+    """
+    SQLite-backed response cache with exact and embedding-similarity lookup.
+    
+    Entries are grouped by namespace (e.g. summaries vs evaluations). Exact hits are
+    looked up by key; near-duplicates are found by cosine similarity against the
+    unit-norm embeddings of a namespace, kept in memory as one stacked matrix.
+    The least recently used entries are evicted past max_entries.
+    """
+    
+    def __init__(self, db_path: str, namespace: str, threshold: float = 0.95, max_entries: int = 10000):
+        """
+        Open (or create) the cache.
+        
+        Args:
+            db_path: SQLite database file
+            namespace: Namespace of the cached responses
+            threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Maximum number of entries kept per namespace
+        """
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, embedding BLOB NOT NULL, "
+            "value TEXT NOT NULL, last_used REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self.connection.commit()
+        self.namespace = namespace
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._keys: List[str] = []
+        self._embeddings: Optional[np.ndarray] = None
+    
+    def _load_embeddings(self) -> None:
+        """Stack the namespace embeddings into one matrix on first use."""
+        rows = self.connection.execute(
+            "SELECT key, embedding FROM responses WHERE namespace = ?", (self.namespace,)
+        ).fetchall()
+        self._keys = [key for key, _ in rows]
+        self._embeddings = (
+            np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows])
+            if rows else np.empty((0, 0), dtype=np.float32)
+        )
+    
+    def _touch(self, key: str) -> None:
+        self.connection.execute(
+            "UPDATE responses SET last_used = ? WHERE namespace = ? AND key = ?",
+            (time.time(), self.namespace, key)
+        )
+        self.connection.commit()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the value stored under an exact key, if any."""
+        row = self.connection.execute(
+            "SELECT value FROM responses WHERE namespace = ? AND key = ?", (self.namespace, key)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touch(key)
+        return row[0]
+    
+    def get_similar(self, embedding: np.ndarray) -> Optional[str]:
+        """Return the value of the most similar entry, if it reaches the threshold."""
+        if self._embeddings is None:
+            self._load_embeddings()
+        if not self._keys:
+            return None
+        
+        similarities = self._embeddings @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.threshold:
+            return None
+        return self.get(self._keys[best])
+    
+    def put(self, key: str, embedding: np.ndarray, value: str) -> None:
+        """Store a value with its unit-norm embedding, evicting old entries if needed."""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO responses (namespace, key, embedding, value, last_used) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (self.namespace, key, embedding.tobytes(), value, time.time())
+        )
+        evicted = self.connection.execute(
+            "DELETE FROM responses WHERE namespace = ? AND key IN ("
+            "SELECT key FROM responses WHERE namespace = ? ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_entries)
+        ).rowcount
+        self.connection.commit()
+        
+        if evicted or self._embeddings is None or key in self._keys:
+            # Rebuild lazily on the next similarity lookup
+            self._embeddings = None
+        else:
+            self._keys.append(key)
+            self._embeddings = (
+                np.vstack([self._embeddings, embedding]) if self._embeddings.size else embedding[np.newaxis]
+            )
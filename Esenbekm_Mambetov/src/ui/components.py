@@ -4,9 +4,22 @@ import streamlit as st
 import pandas as pd
 from typing import Optional
 
-from ..models.review import ReviewsData
+from ..models.review import ReviewsData, ratings_array
 from ..models.summary import ComparisonResult
 from ..config.settings import UIConfig
+from ..utils.fast_stats import avg_rating, rating_histogram
+
+
+def _reviews_data_key(reviews_data: ReviewsData) -> tuple:
+    """Cheap cache key for reviews data: one scrape is identified by its metadata."""
+    metadata = reviews_data.metadata
+    return (metadata.app_id, metadata.scraped_at, len(reviews_data.reviews))
+
+
+@st.cache_data(show_spinner=False, hash_funcs={ReviewsData: _reviews_data_key})
+def build_reviews_dataframe(reviews_data: ReviewsData) -> pd.DataFrame:
+    """Build the reviews table once per loaded reviews file, straight from the Arrow columns."""
+    return reviews_data.columns.to_arrow().to_pandas(types_mapper=pd.ArrowDtype)
 
 
 class UIComponents:
@@ -125,7 +138,7 @@ class UIComponents:
         st.header("📱 Отзывы пользователей")
         
         # Convert to DataFrame
-        df = pd.DataFrame([review.to_dict() for review in reviews_data.reviews])
+        df = build_reviews_dataframe(reviews_data)
         
         # Add filters
         col1, col2 = st.columns(2)
@@ -155,8 +168,8 @@ class UIComponents:
         with col2:
             st.metric("Отфильтровано", len(filtered_df))
         with col3:
-            avg_rating = filtered_df['rating'].mean() if len(filtered_df) > 0 else 0
-            st.metric("Средний рейтинг", f"{avg_rating:.1f}")
+            average_rating = filtered_df['rating'].mean() if len(filtered_df) > 0 else 0
+            st.metric("Средний рейтинг", f"{average_rating:.1f}")
         
         # Display table
         st.dataframe(
@@ -185,16 +198,15 @@ class UIComponents:
         
         reviews = reviews_data.reviews
         total_reviews = len(reviews)
-        avg_rating = sum(r.rating for r in reviews) / total_reviews if reviews else 0
+        ratings = ratings_array(reviews)
+        average_rating = avg_rating(ratings)
         
-        # Rating distribution
-        rating_counts = {}
-        for r in reviews:
-            rating_counts[r.rating] = rating_counts.get(r.rating, 0) + 1
+        # Rating distribution (index = stars)
+        rating_counts = rating_histogram(ratings)
         
-        positive_reviews = sum(rating_counts.get(i, 0) for i in [4, 5])
-        negative_reviews = sum(rating_counts.get(i, 0) for i in [1, 2])
-        neutral_reviews = rating_counts.get(3, 0)
+        positive_reviews = int(rating_counts[4] + rating_counts[5])
+        negative_reviews = int(rating_counts[1] + rating_counts[2])
+        neutral_reviews = int(rating_counts[3])
         
         # Display key metrics in columns
         col1, col2, col3, col4, col5 = st.columns(5)
@@ -209,8 +221,8 @@ class UIComponents:
         with col2:
             st.metric(
                 label="⭐ Средний рейтинг",
-                value=f"{avg_rating:.1f}/5",
-                delta=f"{avg_rating - 3:.1f}" if avg_rating != 3 else None,
+                value=f"{average_rating:.1f}/5",
+                delta=f"{average_rating - 3:.1f}" if average_rating != 3 else None,
                 help="Средняя оценка приложения"
             )
         
@@ -261,7 +273,7 @@ class UIComponents:
         
         with col2:
             # Analysis insights
-            sentiment_emoji = "😊" if avg_rating >= 4 else "😐" if avg_rating >= 3 else "😞"
+            sentiment_emoji = "😊" if average_rating >= 4 else "😐" if average_rating >= 3 else "😞"
             trend_analysis = "положительная" if positive_reviews > negative_reviews else "отрицательная" if negative_reviews > positive_reviews else "нейтральная"
             
             st.markdown(f"""
@@ -269,7 +281,7 @@ class UIComponents:
                 <h4>🔍 Быстрая аналитика</h4>
                 <p><strong>🎯 Общее настроение:</strong> {sentiment_emoji} {trend_analysis.title()}</p>
                 <p><strong>📊 Распределение:</strong> {positive_pct:.0f}% позитивных, {negative_pct:.0f}% негативных</p>
-                <p><strong>🔥 Самый частый рейтинг:</strong> {max(rating_counts.items(), key=lambda x: x[1])[0]}⭐</p>
+                <p><strong>🔥 Самый частый рейтинг:</strong> {int(rating_counts.argmax())}⭐</p>
                 <p><strong>📈 Качество данных:</strong> Высокое ({total_reviews} отзывов)</p>
                 <p><strong>⚡ Актуальность:</strong> Свежие данные</p>
             </div>
@@ -363,9 +375,9 @@ class UIComponents:
         elif negative_pct > 30:
             recommendations.append("⚠️ **Внимание:** Высокий процент негативных отзывов. Рекомендуется анализ основных проблем.")
         
-        if avg_rating < 3:
+        if average_rating < 3:
             recommendations.append("📉 **Низкий рейтинг:** Средняя оценка ниже 3 звезд. Необходимы кардинальные улучшения.")
-        elif avg_rating < 4:
+        elif average_rating < 4:
             recommendations.append("📈 **Улучшение:** Есть потенциал для повышения рейтинга до 4+ звезд.")
         
         if positive_pct > 60:
@@ -1,18 +1,31 @@
 """Chart creation utilities for the dashboard."""
 
-import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import List
+from typing import List, Sequence
 
-from ..models.review import Review
+from ..models.review import Review, ReviewsColumnar, parse_days, ratings_array
 from ..models.summary import ComparisonResult
 from ..config.settings import UIConfig
+from .fast_stats import rating_histogram
 
 
 class ChartUtils:
     """Utility class for creating dashboard charts."""
     
+    @staticmethod
+    def _dates_array(reviews: Sequence[Review]) -> np.ndarray:
+        """Review dates as a datetime64[D] array; missing or unparseable dates are NaT."""
+        if isinstance(reviews, ReviewsColumnar):
+            return reviews.days
+        return parse_days(np.array([review.date for review in reviews], dtype=object))
+    
+    @staticmethod
+    def _render_mode(point_count: int) -> str:
+        """Pick Plotly Express render mode: WebGL for large point counts, SVG otherwise."""
+        return 'webgl' if point_count >= UIConfig.WEBGL_MIN_POINTS else 'svg'
+    
     @staticmethod
     def create_rating_distribution_chart(reviews: List[Review]) -> go.Figure:
         """
@@ -24,15 +37,15 @@ class ChartUtils:
         Returns:
             Plotly figure
         """
-        ratings = [review.rating for review in reviews]
-        rating_counts = pd.Series(ratings).value_counts().sort_index()
+        counts = rating_histogram(ratings_array(reviews))
+        present = np.nonzero(counts)[0]
         
         fig = px.bar(
-            x=rating_counts.index,
-            y=rating_counts.values,
+            x=present,
+            y=counts[present],
             labels={'x': 'Рейтинг', 'y': 'Количество отзывов'},
             title="Распределение рейтингов",
-            color=rating_counts.values,
+            color=counts[present],
             color_continuous_scale=UIConfig.RATING_COLOR_SCALE
         )
         
@@ -55,9 +68,10 @@ class ChartUtils:
         Returns:
             Plotly figure
         """
-        dates = [review.date for review in reviews if review.date]
+        dates = ChartUtils._dates_array(reviews)
+        days = dates[~np.isnat(dates)].view('i8')
         
-        if not dates:
+        if not days.size:
             return go.Figure().add_annotation(
                 text="Нет данных для отображения временной динамики",
                 xref="paper", yref="paper",
@@ -65,13 +79,17 @@ class ChartUtils:
                 showarrow=False, font_size=16
             )
         
-        date_counts = pd.Series(dates).value_counts().sort_index()
+        # Count reviews per day over day offsets from the earliest date
+        first_day = days.min()
+        day_counts = np.bincount(days - first_day)
+        present = np.nonzero(day_counts)[0]
         
         fig = px.line(
-            x=date_counts.index,
-            y=date_counts.values,
+            x=(first_day + present).astype('datetime64[D]'),
+            y=day_counts[present],
             labels={'x': 'Дата', 'y': 'Количество отзывов'},
-            title="Динамика отзывов по времени"
+            title="Динамика отзывов по времени",
+            render_mode=ChartUtils._render_mode(len(present))
         )
         
         fig.update_layout(
@@ -143,28 +161,33 @@ class ChartUtils:
         if not reviews:
             return go.Figure()
         
-        # Create DataFrame
-        df = pd.DataFrame([
-            {'date': review.date, 'rating': review.rating} 
-            for review in reviews if review.date
-        ])
+        dates = ChartUtils._dates_array(reviews)
+        dated = ~np.isnat(dates)
         
-        if df.empty:
+        if not dated.any():
             return go.Figure()
         
-        # Convert date and sort
-        df['date'] = pd.to_datetime(df['date'])
-        df = df.sort_values('date')
+        # Sort by date
+        order = np.argsort(dates[dated], kind='stable')
+        dates = dates[dated][order]
+        ratings = ratings_array(reviews)[dated][order].astype(np.float64)
+        
+        # Moving average over the last 10 reviews from running sums
+        window = 10
+        running_sum = np.concatenate(([0.0], np.cumsum(ratings)))
+        end = np.arange(1, len(ratings) + 1)
+        start = np.maximum(end - window, 0)
+        rating_ma = (running_sum[end] - running_sum[start]) / (end - start)
         
-        # Calculate moving average
-        df['rating_ma'] = df['rating'].rolling(window=10, min_periods=1).mean()
+        # WebGL keeps large scatter plots responsive in the browser
+        scatter = go.Scattergl if len(ratings) >= UIConfig.WEBGL_MIN_POINTS else go.Scatter
         
         fig = go.Figure()
         
         # Add scatter plot for individual ratings
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['rating'],
+        fig.add_trace(scatter(
+            x=dates,
+            y=ratings,
             mode='markers',
             name='Отдельные рейтинги',
             opacity=0.6,
@@ -172,9 +195,9 @@ class ChartUtils:
         ))
         
         # Add moving average line
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['rating_ma'],
+        fig.add_trace(scatter(
+            x=dates,
+            y=rating_ma,
             mode='lines',
             name='Скользящее среднее (10 отзывов)',
             line=dict(width=3)
@@ -203,13 +226,11 @@ class ChartUtils:
         if not reviews:
             return go.Figure()
         
-        # Categorize ratings into sentiment
-        positive = len([r for r in reviews if r.rating >= 4])
-        neutral = len([r for r in reviews if r.rating == 3])
-        negative = len([r for r in reviews if r.rating <= 2])
+        # Categorize ratings into sentiment; missing ratings (bin 0) fall in the negative slice
+        counts = rating_histogram(ratings_array(reviews))
         
         labels = ['Положительные (4-5★)', 'Нейтральные (3★)', 'Отрицательные (1-2★)']
-        values = [positive, neutral, negative]
+        values = [int(counts[4:].sum()), int(counts[3]), int(counts[:3].sum())]
         colors = ['#2ecc71', '#f39c12', '#e74c3c']
         
         fig = go.Figure(data=[go.Pie(
@@ -0,0 +1,42 @@
+"""Compiled numeric kernels for review rating statistics.
+
+The kernels are loaded from the ahead-of-time build produced by
+``python -m scripts.build_fast_stats`` when it is present, so neither numba nor the
+JIT compiler is touched at startup. Without it they are JIT-compiled on first use.
+"""
+
+import numpy as np
+
+# Ratings are 1-5 stars; bin 0 collects missing ratings
+RATING_BINS = 6
+
+RATING_HISTOGRAM_SIGNATURE = "int64[:](int8[:])"
+AVG_RATING_SIGNATURE = "float64(int8[:])"
+
+
+def _rating_histogram(ratings):
+    """Count reviews per rating value (index = stars)."""
+    counts = np.zeros(RATING_BINS, dtype=np.int64)
+    for rating in ratings:
+        if 0 <= rating < RATING_BINS:
+            counts[rating] += 1
+    return counts
+
+
+def _avg_rating(ratings):
+    """Average rating, or 0.0 for an empty array."""
+    if ratings.size == 0:
+        return 0.0
+    total = 0
+    for rating in ratings:
+        total += rating
+    return total / ratings.size
+
+
+try:
+    from ._fast_stats_aot import rating_histogram, avg_rating
+except ImportError:
+    from numba import njit
+
+    rating_histogram = njit(RATING_HISTOGRAM_SIGNATURE, cache=True)(_rating_histogram)
+    avg_rating = njit(AVG_RATING_SIGNATURE, cache=True)(_avg_rating)
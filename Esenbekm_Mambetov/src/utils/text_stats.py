@@ -0,0 +1,11 @@
+"""Text statistics shared by the summarization services."""
+
+import re
+
+# A sentence starts at a non-space character and runs to its terminators (or the end of the text)
+SENTENCE_RE = re.compile(r'[^.!?\s][^.!?]*(?:[.!?]+|$)')
+
+
+def count_sentences(text: str) -> int:
+    """Count sentences ending in '.', '!' or '?', plus a trailing unterminated one."""
+    return sum(1 for _ in SENTENCE_RE.finditer(text))
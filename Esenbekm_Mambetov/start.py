@@ -9,9 +9,6 @@ import os
 import subprocess
 import argparse
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
 from src.config.settings import AppConfig, get_openai_config
 from src.services.data_service import DataService
 from src.utils.logger import Logger
@@ -0,0 +1,171 @@
+"""
+Test how agent answers become summaries and evaluations
+"""
+import types
+import zlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip('agents')
+
+from src.models.review import Review
+from src.models.summary import SummaryResult
+from src.services import agent_service
+from src.services.agent_service import AppSummaries, AppSummary, EvaluationScores, ReviewAnalysisAgent
+from src.services.summary_cache import normalize_text
+
+SCORES = EvaluationScores(
+    extractive_coverage=6,
+    abstractive_coverage=8,
+    extractive_clarity=5,
+    abstractive_clarity=9,
+    extractive_usefulness=6,
+    abstractive_usefulness=8,
+    extractive_key_details=7,
+    abstractive_key_details=7,
+    preferred_summary="abstractive",
+    reasoning="Абстрактивное резюме понятнее."
+)
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    """Stub Runner.run: it answers with the queued final outputs and records the agents it ran"""
+    runs = types.SimpleNamespace(answers=[], agents=[])
+    
+    async def run(agent, prompt, **kwargs):
+        runs.agents.append(agent)
+        return types.SimpleNamespace(final_output=runs.answers.pop(0))
+    
+    monkeypatch.setattr(agent_service.Runner, 'run', run)
+    return runs
+
+
+@pytest.fixture
+def embedded():
+    """Texts sent to the embeddings endpoint"""
+    return []
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path, embedded):
+    # Word counts stand in for model tokens, so no tokenizer files are needed
+    monkeypatch.setattr(agent_service, 'count_tokens', lambda text: len(text.split()))
+    monkeypatch.setattr(agent_service.SummarizationConfig, 'SEMANTIC_CACHE_FILE', str(tmp_path / 'cache.sqlite'))
+    agent = ReviewAnalysisAgent('sk-test')
+    
+    async def create_embedding(model, input):
+        # Hashed bag of words: texts sharing most words get similar embeddings
+        embedded.append(input)
+        vector = np.zeros(256)
+        for word in input.split():
+            vector[zlib.crc32(word.encode()) % 256] += 1
+        return types.SimpleNamespace(data=[types.SimpleNamespace(embedding=vector.tolist())])
+    
+    monkeypatch.setattr(agent, 'client', types.SimpleNamespace(
+        embeddings=types.SimpleNamespace(create=create_embedding)
+    ))
+    return agent
+
+
+def app_reviews(app: str, text: str = "Отзыв {i} о приложении {app}. ") -> list:
+    """Enough review text for the agent rather than a templated summary"""
+    return [
+        Review(id=f"{app}-{i}", rating=i % 5 + 1, text=text.format(i=i, app=app) * 10, author="a", date="")
+        for i in range(4)
+    ]
+
+
+def summary(summary_type: str, text: str) -> SummaryResult:
+    return SummaryResult(
+        summary_type=summary_type,
+        text=text,
+        word_count=len(text.split()),
+        sentence_count=1,
+        processing_time=0.1
+    )
+
+
+def evaluate(agent: ReviewAnalysisAgent):
+    return agent.evaluate_summaries(
+        summary("extractive", "Приложение часто зависает при входе."),
+        summary("abstractive_agent", "Пользователи жалуются на зависания при входе, но хвалят переводы.")
+    )
+
+
+class TestAgentEvaluation:
+    """Test evaluation with structured output"""
+    
+    def test_structured_answer_becomes_analysis(self, agent, runs):
+        """The schema-validated scores are the report analysis, not the fallback"""
+        runs.answers.append(SCORES)
+        report = evaluate(agent)
+        assert runs.agents == [agent.evaluation_agent]
+        assert report.analysis == SCORES.model_dump()
+        assert report.get_preferred_summary() == "abstractive"
+
+
+class TestMultiAppSummaries:
+    """Test several apps summarized in one structured agent answer"""
+    
+    def test_structured_answer_is_split_per_app(self, agent, runs):
+        """Each app gets the summary with its number"""
+        runs.answers.append(AppSummaries(summaries=[
+            AppSummary(app_number=2, summary="Второе приложение хвалят."),
+            AppSummary(app_number=1, summary="Первое приложение зависает."),
+        ]))
+        results = agent.create_summaries([app_reviews("one"), app_reviews("two")])
+        assert runs.agents == [agent.multi_summary_agent]
+        assert [result.text for result in results] == ["Первое приложение зависает.", "Второе приложение хвалят."]
+    
+    def test_groups_fit_the_answer_length(self, agent, monkeypatch):
+        """A group holds no more apps than the model can answer for in one response"""
+        monkeypatch.setattr(agent_service.SummarizationConfig, 'AGENT_OUTPUT_TOKENS', 600)
+        blocks = {index: agent._build_app_block(index + 1, app_reviews(str(index))) for index in range(5)}
+        assert [list(group) for group in agent._group_app_blocks(blocks)] == [[0, 1], [2, 3], [4]]
+
+
+class TestAgentResponseCache:
+    """Test which text the semantic cache compares"""
+    
+    def test_summary_embeds_only_the_reviews(self, agent, runs, embedded):
+        """The fixed instructions and metrics are not part of the embedded text"""
+        reviews = app_reviews("one")
+        runs.answers.append("Первое приложение зависает.")
+        agent.create_summary(reviews)
+        assert embedded == [normalize_text(agent._prepare_reviews_for_agent(reviews))]
+    
+    def test_evaluation_embeds_only_the_summaries(self, agent, runs, embedded):
+        """The evaluation is looked up by the two summary texts"""
+        runs.answers.append(SCORES)
+        evaluate(agent)
+        assert embedded == [normalize_text(
+            "Приложение часто зависает при входе.\n"
+            "Пользователи жалуются на зависания при входе, но хвалят переводы."
+        )]
+    
+    def test_unrelated_reviews_are_not_served_from_cache(self, agent, runs):
+        """Another app's reviews get their own summary, despite the shared prompt text"""
+        runs.answers.extend(["Первое приложение зависает.", "Второе приложение хвалят."])
+        first = agent.create_summary(app_reviews("one", "Не могу войти, приложение зависает {i}. "))
+        second = agent.create_summary(app_reviews("two", "Удобные переводы и быстрый кэшбэк {i}. "))
+        assert (first.text, second.text) == ("Первое приложение зависает.", "Второе приложение хвалят.")
+    
+    def test_same_reviews_are_served_from_cache(self, agent, runs):
+        """A repeated summary request does not run the agent again"""
+        runs.answers.append("Первое приложение зависает.")
+        first = agent.create_summary(app_reviews("one"))
+        second = agent.create_summary(app_reviews("one"))
+        assert len(runs.agents) == 1
+        assert second.text == first.text
+
+
+class TestAgentSettings:
+    """Test the model settings every agent run is sent with"""
+    
+    def test_prompt_cache_key_is_sent_in_the_body(self, agent):
+        """The prompt cache key survives per-run overrides such as max_tokens"""
+        settings = agent.multi_summary_agent.model_settings.resolve(agent_service.ModelSettings(max_tokens=600))
+        assert settings.extra_body == {"prompt_cache_key": agent_service.SummarizationConfig.AGENT_PROMPT_CACHE_KEY}
+        assert settings.max_tokens == 600
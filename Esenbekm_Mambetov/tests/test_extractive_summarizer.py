@@ -0,0 +1,48 @@
+"""
+Test the NumPy LexRank summarizer against sumy's
+"""
+import random
+
+import pytest
+
+pytest.importorskip('sumy')
+pytest.importorskip('agents')
+
+from sumy.nlp.stemmers import Stemmer
+from sumy.parsers.plaintext import PlaintextParser
+from sumy.summarizers.lex_rank import LexRankSummarizer
+
+from src.services.summarization_service import RegexTokenizer, VectorizedLexRankSummarizer
+
+WORDS = (
+    'приложение работает плохо хорошо удобно банк перевод ошибка сбой карта деньги быстро '
+    'поддержка вход пароль обновление кэшбэк комиссия курс валюта'
+).split()
+
+
+def random_text(seed: int, sentence_count: int) -> str:
+    """Sentences of random review words, some empty or numeric only"""
+    rng = random.Random(seed)
+    return ' '.join(
+        ' '.join(rng.choice(WORDS) for _ in range(rng.randint(0, 10))) + rng.choice(['.', '!', '?', '. 123.'])
+        for _ in range(sentence_count)
+    )
+
+
+def summarize(summarizer_class, text: str, sentences_count: int = 3):
+    document = PlaintextParser.from_string(text, RegexTokenizer('russian')).document
+    return [str(sentence) for sentence in summarizer_class(Stemmer('russian'))(document, sentences_count)]
+
+
+class TestVectorizedLexRank:
+    """The vectorized summarizer picks the same sentences as sumy"""
+    
+    @pytest.mark.parametrize('seed, sentence_count', [(1, 5), (2, 30), (3, 120)])
+    def test_matches_sumy(self, seed, sentence_count):
+        text = random_text(seed, sentence_count)
+        assert summarize(VectorizedLexRankSummarizer, text) == summarize(LexRankSummarizer, text)
+    
+    def test_sentences_without_words(self):
+        """Sentences with no words after tokenizing do not break the similarity matrix"""
+        text = '123. 456!'
+        assert summarize(VectorizedLexRankSummarizer, text) == summarize(LexRankSummarizer, text)
@@ -0,0 +1,85 @@
+"""
+Test the columnar review storage
+"""
+import numpy as np
+import pytest
+
+from src.models.review import Review, ReviewsColumnar, ReviewsData, parse_days
+
+
+RECORDS = [
+    {'id': 'r1', 'rating': 5, 'text': 'Отличное приложение', 'author': 'Анна', 'date': '2024-01-02'},
+    {'id': 'r2', 'rating': 1, 'text': 'Не работает вход', 'author': 'Иван', 'date': '02/01/2024'},
+    {'id': 'r3', 'rating': 3, 'text': 'Нормально', 'author': 'Олег', 'date': '2024-01-03T10:15:00'},
+    {'id': 'r4', 'rating': 4, 'text': '', 'author': '', 'date': ''},
+]
+
+
+class TestReviewsColumnar:
+    """Test ReviewsColumnar conversions"""
+    
+    def test_records_round_trip(self):
+        """Records come back unchanged, including non-ISO and timestamp dates"""
+        assert ReviewsColumnar.from_records(RECORDS).to_records() == RECORDS
+    
+    def test_days_view(self):
+        """Dates parse to days; empty and unparseable dates are NaT"""
+        days = ReviewsColumnar.from_records(RECORDS).days
+        assert days.dtype == np.dtype('datetime64[D]')
+        assert days[0] == np.datetime64('2024-01-02')
+        assert np.isnat(days[1])
+        assert days[2] == np.datetime64('2024-01-03')
+        assert np.isnat(days[3])
+    
+    def test_indexing(self):
+        """Integer indexing yields Review objects, slices stay columnar"""
+        reviews = ReviewsColumnar.from_records(RECORDS)
+        assert reviews[1] == Review.from_dict(RECORDS[1])
+        assert list(reviews[1:3]) == [Review.from_dict(record) for record in RECORDS[1:3]]
+        assert reviews[1:3].days.shape == (2,)
+    
+    def test_loose_value_types_are_coerced(self):
+        """Int ids, string ratings and missing fields do not fail the conversion"""
+        records = [
+            {'id': 7, 'rating': '5', 'text': None, 'author': 'Анна', 'date': '2024-01-02'},
+            {'id': 'r2', 'rating': 'пять', 'text': 'Хорошо'},
+        ]
+        assert ReviewsColumnar.from_records(records).to_records() == [
+            {'id': '7', 'rating': 5, 'text': '', 'author': 'Анна', 'date': '2024-01-02'},
+            {'id': 'r2', 'rating': 0, 'text': 'Хорошо', 'author': '', 'date': ''},
+        ]
+    
+    def test_parse_days(self):
+        """parse_days takes the fast path for ISO dates"""
+        dates = np.array(['2024-01-02', ''], dtype=object)
+        assert parse_days(dates).tolist() == [np.datetime64('2024-01-02').item(), None]
+
+
+class TestReviewsData:
+    """Test ReviewsData serialization"""
+    
+    @pytest.fixture
+    def data(self):
+        return {
+            'reviews': RECORDS,
+            'metadata': {
+                'app_id': 'com.example.bank',
+                'scraped_at': '2024-01-04T00:00:00',
+                'total_reviews': len(RECORDS),
+                'language': 'ru',
+                'country': 'ru'
+            }
+        }
+    
+    def test_from_dict_matches_review_objects(self, data):
+        """from_dict yields the same reviews as building Review objects one by one"""
+        reviews_data = ReviewsData.from_dict(data)
+        assert list(reviews_data.reviews) == [Review.from_dict(record) for record in RECORDS]
+    
+    def test_to_dict_round_trip(self, data):
+        """to_dict returns the reviews it was built from"""
+        assert ReviewsData.from_dict(data).to_dict()['reviews'] == RECORDS
+    
+    def test_average_rating(self, data):
+        """Average rating over the columnar ratings"""
+        assert ReviewsData.from_dict(data).get_average_rating() == pytest.approx(13 / 4)
@@ -0,0 +1,48 @@
+"""
+Test .env loading
+"""
+import os
+
+import pytest
+
+from src.config import settings
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, '_ENV_FILE_VALUES', {})
+    monkeypatch.delenv('ENV_TEST_FROM_FILE', raising=False)
+    monkeypatch.setenv('ENV_TEST_EXPORTED', 'shell')
+    settings._apply_env_file.cache_clear()
+    yield tmp_path / '.env'
+    settings._apply_env_file.cache_clear()
+    os.environ.pop('ENV_TEST_FROM_FILE', None)
+
+
+def apply(env_file, text: str, mtime_ns: int) -> None:
+    env_file.write_text(text)
+    settings._apply_env_file(env_file, mtime_ns)
+
+
+class TestEnvFile:
+    """Test applying and reloading .env values"""
+    
+    def test_exported_variables_take_precedence(self, env_file):
+        """.env does not override variables set in the environment"""
+        apply(env_file, 'ENV_TEST_FROM_FILE=1\nENV_TEST_EXPORTED=env\n', 1)
+        assert os.environ['ENV_TEST_FROM_FILE'] == '1'
+        assert os.environ['ENV_TEST_EXPORTED'] == 'shell'
+    
+    def test_reload_updates_values_from_file(self, env_file):
+        """A changed .env overwrites the values it set before"""
+        apply(env_file, 'ENV_TEST_FROM_FILE=1\nENV_TEST_EXPORTED=env\n', 1)
+        apply(env_file, 'ENV_TEST_FROM_FILE=2\nENV_TEST_EXPORTED=env2\n', 2)
+        assert os.environ['ENV_TEST_FROM_FILE'] == '2'
+        assert os.environ['ENV_TEST_EXPORTED'] == 'shell'
+    
+    def test_reload_keeps_values_changed_at_runtime(self, env_file):
+        """Variables changed after loading are not overwritten by a reload"""
+        apply(env_file, 'ENV_TEST_FROM_FILE=1\n', 1)
+        os.environ['ENV_TEST_FROM_FILE'] = 'runtime'
+        apply(env_file, 'ENV_TEST_FROM_FILE=2\n', 2)
+        assert os.environ['ENV_TEST_FROM_FILE'] == 'runtime'
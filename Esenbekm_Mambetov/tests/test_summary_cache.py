@@ -0,0 +1,78 @@
+"""
+Test the semantic response cache
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+from src.services import summary_cache
+from src.services.summary_cache import SemanticCache
+
+
+def unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@pytest.fixture(autouse=True)
+def ordered_clock(monkeypatch):
+    """Strictly increasing timestamps, so LRU order does not depend on clock resolution"""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(summary_cache.time, 'time', lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SemanticCache(str(tmp_path / 'cache.db'), 'summaries', threshold=0.9, max_entries=2)
+
+
+class TestSemanticCache:
+    """Test lookup, eviction and the in-memory embedding matrix"""
+    
+    def test_exact_and_similar_lookup(self, cache):
+        """Exact keys and near-duplicate embeddings hit, distant ones miss"""
+        cache.put('a', unit(1, 0, 0), 'A')
+        assert cache.get('a') == 'A'
+        assert cache.get_similar(unit(1, 0.1, 0)) == 'A'
+        assert cache.get_similar(unit(0, 1, 0)) is None
+    
+    def test_least_recently_used_is_evicted(self, cache):
+        """Past max_entries the least recently used entry is dropped"""
+        cache.put('a', unit(1, 0, 0), 'A')
+        cache.put('b', unit(0, 1, 0), 'B')
+        cache.get('a')
+        cache.put('c', unit(0, 0, 1), 'C')
+        assert cache.get('b') is None
+        assert cache.get('a') == 'A'
+        assert cache.get('c') == 'C'
+    
+    def test_put_appends_to_loaded_matrix(self, cache):
+        """New keys extend the loaded matrix in place of a reload"""
+        cache.put('a', unit(1, 0, 0), 'A')
+        assert cache.get_similar(unit(1, 0, 0)) == 'A'
+        cache.put('b', unit(0, 1, 0), 'B')
+        assert cache._keys == ['a', 'b']
+        assert cache._embeddings.shape == (2, 3)
+        assert cache.get_similar(unit(0, 1, 0)) == 'B'
+    
+    def test_eviction_rebuilds_matrix_lazily(self, cache):
+        """Eviction drops the matrix; the next similarity lookup rebuilds it without the evicted key"""
+        # The similarity hit on 'a' makes 'b' the least recently used
+        cache.put('a', unit(1, 0, 0), 'A')
+        cache.put('b', unit(0, 1, 0), 'B')
+        assert cache.get_similar(unit(1, 0, 0)) == 'A'
+        cache.put('c', unit(0, 0, 1), 'C')
+        assert cache._embeddings is None
+        assert cache.get_similar(unit(0, 1, 0)) is None
+        assert sorted(cache._keys) == ['a', 'c']
+        assert cache.get_similar(unit(0, 0, 1)) == 'C'
+    
+    def test_namespaces_are_separate(self, tmp_path):
+        """Entries are only visible within their namespace"""
+        db_path = str(tmp_path / 'cache.db')
+        SemanticCache(db_path, 'summaries').put('a', unit(1, 0), 'A')
+        evaluations = SemanticCache(db_path, 'evaluations')
+        assert evaluations.get('a') is None
+        assert evaluations.get_similar(unit(1, 0)) is None
+        assert SemanticCache(db_path, 'summaries').get_similar(unit(1, 0)) == 'A'